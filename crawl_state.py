@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Resumable BFS crawl state
+SQLite-backed progress for the BFS PDF discovery crawler, one crawl per
+set of start URLs and allowed domains. Standard library only.
+"""
+
+import hashlib
+import sqlite3
+
+from crawl_urls import canonicalize
+
+
+def crawl_id(start_urls, allowed_domains):
+    """
+    Identify a crawl by what it was started with
+    
+    Start URLs are compared by canonical key and domains case-insensitively,
+    both ignoring order, so only a genuinely different crawl gets a new id.
+    
+    Returns:
+        Hex SHA-256 of the crawl's seeds
+    """
+    seeds = sorted({canonicalize(url) for url in start_urls})
+    domains = sorted({domain.lower() for domain in allowed_domains})
+    return hashlib.sha256('\n'.join(seeds + [''] + domains).encode()).hexdigest()
+
+
+class CrawlState:
+    """Progress of one BFS crawl, saved level by level so a later run can resume it"""
+    
+    def __init__(self, path, crawl_key):
+        """
+        Args:
+            path: SQLite file (created if needed); it can hold several crawls
+            crawl_key: Id of this crawl, from crawl_id()
+        """
+        self.crawl_key = crawl_key
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS crawls (
+                crawl_id TEXT PRIMARY KEY,
+                next_depth INTEGER NOT NULL,
+                finished INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS crawl_visited (
+                crawl_id TEXT NOT NULL, url_key TEXT NOT NULL,
+                PRIMARY KEY (crawl_id, url_key)
+            );
+            CREATE TABLE IF NOT EXISTS crawl_failed (
+                crawl_id TEXT NOT NULL, url TEXT NOT NULL,
+                PRIMARY KEY (crawl_id, url)
+            );
+            CREATE TABLE IF NOT EXISTS crawl_pdfs (
+                crawl_id TEXT NOT NULL, url TEXT NOT NULL,
+                PRIMARY KEY (crawl_id, url)
+            );
+            CREATE TABLE IF NOT EXISTS crawl_frontier (
+                crawl_id TEXT NOT NULL, url TEXT NOT NULL,
+                PRIMARY KEY (crawl_id, url)
+            );
+        """)
+    
+    def load(self):
+        """
+        Restore this crawl's saved progress
+        
+        Pages whose fetch failed were never marked visited; they are queued
+        again ahead of the saved frontier, at the depth the crawl resumes at.
+        
+        Returns:
+            None if this crawl was never saved, else a dict with 'frontier'
+            (URLs to fetch next), 'depth' (their BFS depth), 'visited'
+            (canonical keys of pages fetched successfully), 'pdfs'
+            (canonical key -> PDF URL) and 'finished' (True once the crawl
+            ran to completion with no failed pages left to retry)
+        """
+        row = self.conn.execute(
+            'SELECT next_depth, finished FROM crawls WHERE crawl_id = ?', (self.crawl_key,)
+        ).fetchone()
+        if row is None:
+            return None
+        next_depth, finished = row
+        
+        failed = self._column('SELECT url FROM crawl_failed WHERE crawl_id = ?')
+        frontier = self._column('SELECT url FROM crawl_frontier WHERE crawl_id = ?')
+        return {
+            'frontier': list(dict.fromkeys(failed + frontier)),
+            'depth': next_depth,
+            'visited': set(self._column('SELECT url_key FROM crawl_visited WHERE crawl_id = ?')),
+            'pdfs': {canonicalize(url): url
+                     for url in self._column('SELECT url FROM crawl_pdfs WHERE crawl_id = ?')},
+            'finished': bool(finished) and not failed
+        }
+    
+    def save_level(self, fetched, failed, pdfs_found, next_frontier, next_depth):
+        """
+        Persist one finished BFS level in a single transaction
+        
+        Args:
+            fetched: URLs of this level that were fetched successfully
+            failed: URLs of this level whose fetch failed (retried on resume)
+            pdfs_found: Canonical key -> PDF URL, everything found so far
+            next_frontier: URLs queued for the next level
+            next_depth: BFS depth of next_frontier
+        """
+        key = self.crawl_key
+        with self.conn:
+            self.conn.execute(
+                'INSERT INTO crawls (crawl_id, next_depth) VALUES (?, ?) '
+                'ON CONFLICT (crawl_id) DO UPDATE SET next_depth = excluded.next_depth, finished = 0',
+                (key, next_depth)
+            )
+            self.conn.executemany('INSERT OR IGNORE INTO crawl_visited VALUES (?, ?)',
+                                  ((key, canonicalize(url)) for url in fetched))
+            self.conn.executemany('DELETE FROM crawl_failed WHERE crawl_id = ? AND url = ?',
+                                  ((key, url) for url in fetched))
+            self.conn.executemany('INSERT OR IGNORE INTO crawl_failed VALUES (?, ?)',
+                                  ((key, url) for url in failed))
+            self.conn.executemany('INSERT OR IGNORE INTO crawl_pdfs VALUES (?, ?)',
+                                  ((key, url) for url in pdfs_found.values()))
+            self.conn.execute('DELETE FROM crawl_frontier WHERE crawl_id = ?', (key,))
+            self.conn.executemany('INSERT OR IGNORE INTO crawl_frontier VALUES (?, ?)',
+                                  ((key, url) for url in next_frontier))
+    
+    def mark_finished(self):
+        """Record that the crawl ran out of pages to visit"""
+        with self.conn:
+            self.conn.execute('UPDATE crawls SET finished = 1 WHERE crawl_id = ?', (self.crawl_key,))
+    
+    def close(self):
+        self.conn.close()
+    
+    def _column(self, query):
+        """First column of a per-crawl query, as a list"""
+        return [value for (value,) in self.conn.execute(query, (self.crawl_key,))]
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+URL helpers for the BFS PDF discovery crawler
+Standard library only, so they can be tested without a browser or network
+"""
+
+import re
+from urllib.parse import urljoin, urlsplit, urlunsplit, urldefrag, parse_qsl, urlencode
+
+
+# Query parameters that only track the click and never change the page served
+TRACKING_PARAM_RE = re.compile(r'utm_\w+|gclid|fbclid|msclkid|mc_cid|mc_eid|_ga|_gl', re.I)
+
+DEFAULT_PORTS = {'http': ':80', 'https': ':443'}
+
+def canonicalize(url):
+    """
+    Normalize a URL for de-duplication
+    
+    Drops the fragment, tracking parameters (``utm_*``, ``gclid``, ...) and
+    default ports, sorts the remaining query parameters, lowercases scheme
+    and host and removes a trailing slash, so the variants a portal links
+    to (``page/#top``, ``?b=2&a=1``, ``?utm_source=nav``) map to one key.
+    
+    The result is only a key: pages are fetched, and their links resolved,
+    with the URL as linked (see resolve_link), since dropping the trailing
+    slash changes what relative links on the page point at.
+    """
+    parts = urlsplit(urldefrag(url)[0])
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    default_port = DEFAULT_PORTS.get(scheme)
+    if default_port and netloc.endswith(default_port):
+        netloc = netloc[:-len(default_port)]
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not TRACKING_PARAM_RE.fullmatch(key)
+    ))
+    return urlunsplit((scheme, netloc, parts.path.rstrip('/') or '/', query, ''))
+
+def resolve_link(base_url, href):
+    """Absolute URL of a link on the page at base_url, without its fragment"""
+    return urldefrag(urljoin(base_url, href))[0]
@@ -5,11 +5,13 @@ Basic Usage Examples for Healthcare Payer Knowledge Base Crawler
 
 from payer_portal_crawler import PayerPortalCrawler
 
-def example_single_payer():
+def example_single_payer(crawler=None):
     """Example: Extract from a single payer"""
     print("Example 1: Single Payer Extraction")
     
-    crawler = PayerPortalCrawler(headless=True, timeout=30)
+    owns_crawler = crawler is None
+    if owns_crawler:
+        crawler = PayerPortalCrawler(headless=True, timeout=30)
     
     try:
         # Extract from United Healthcare
@@ -29,13 +31,16 @@ def example_single_payer():
             print("❌ Extraction failed")
             
     finally:
-        crawler.close()
+        if owns_crawler:
+            crawler.close()
 
-def example_all_payers():
+def example_all_payers(crawler=None):
     """Example: Extract from all configured payers"""
     print("\\nExample 2: All Payers Extraction")
     
-    crawler = PayerPortalCrawler(headless=True)
+    owns_crawler = crawler is None
+    if owns_crawler:
+        crawler = PayerPortalCrawler(headless=True)
     
     try:
         # Extract from all payers
@@ -55,8 +60,14 @@ def example_all_payers():
         print(f"🏥 Payers processed: {summary.get('total_payers', 0)}")
         
     finally:
-        crawler.close()
+        if owns_crawler:
+            crawler.close()
 
 if __name__ == "__main__":
-    example_single_payer()
-    example_all_payers()
\ No newline at end of file
+    # One crawler (browser and connection pool) for every example
+    crawler = PayerPortalCrawler(headless=True, timeout=30)
+    try:
+        example_single_payer(crawler)
+        example_all_payers(crawler)
+    finally:
+        crawler.close()
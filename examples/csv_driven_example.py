@@ -4,14 +4,16 @@ CSV-Driven Crawler Examples
 """
 
 from intelligent_csv_crawler import IntelligentCSVCrawler
+from payer_portal_crawler import create_http_session
 
-def example_auto_discovery():
+def example_auto_discovery(session=None):
     """Example: Auto-discover payer configurations from CSV"""
     print("Example 1: Auto-Discovery from CSV")
     
     crawler = IntelligentCSVCrawler(
         csv_file="payer_companies.csv",
-        headless=True
+        headless=True,
+        session=session
     )
     
     try:
@@ -36,14 +38,15 @@ def example_auto_discovery():
     finally:
         crawler.close()
 
-def example_priority_crawling():
+def example_priority_crawling(session=None):
     """Example: Crawl only high-priority payers"""
     print("\\nExample 2: Priority-Based Crawling")
     
     crawler = IntelligentCSVCrawler(
         csv_file="payer_companies.csv",
         headless=True,
-        max_depth=2  # Faster crawling
+        max_depth=2,  # Faster crawling
+        session=session
     )
     
     try:
@@ -69,14 +72,12 @@ def example_priority_crawling():
     finally:
         crawler.close()
 
-def example_custom_csv():
-    """Example: Use custom CSV with different payers"""
-    print("\\nExample 3: Custom CSV File")
-    
-    # Create custom CSV
-    import pandas as pd
+def example_custom_csv(session=None):
+    """Example: Crawl a custom list of payers without a CSV file"""
+    print("\\nExample 3: Custom Payer List")
     
-    custom_payers = pd.DataFrame([
+    # Hand the payers over in memory; no pandas or temporary CSV needed
+    custom_payers = [
         {
             'company_name': 'Blue Cross Blue Shield of Texas',
             'base_domain': 'bcbstx.com',
@@ -89,15 +90,13 @@ def example_custom_csv():
             'priority': 'medium',
             'known_provider_portal': None  # Will auto-discover
         }
-    ])
-    
-    custom_payers.to_csv("custom_payers.csv", index=False)
-    print("Created custom CSV with 2 payers")
+    ]
+    print(f"Using {len(custom_payers)} custom payers")
     
-    # Use custom CSV
     crawler = IntelligentCSVCrawler(
-        csv_file="custom_payers.csv",
-        headless=True
+        rows=custom_payers,
+        headless=True,
+        session=session
     )
     
     try:
@@ -109,6 +108,11 @@ def example_custom_csv():
         crawler.close()
 
 if __name__ == "__main__":
-    example_auto_discovery()
-    example_priority_crawling()
-    example_custom_csv()
\ No newline at end of file
+    # One connection pool for every example, so repeat hosts stay warm
+    session = create_http_session()
+    try:
+        example_auto_discovery(session)
+        example_priority_crawling(session)
+        example_custom_csv(session)
+    finally:
+        session.close()
\ No newline at end of file
@@ -15,26 +15,101 @@ Author: Development Team
 Date: October 2025
 """
 
-import pandas as pd
+import csv
+import hashlib
+import os
 import time
-import json
-import logging
+import orjson
+import socket
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 from urllib.parse import urljoin, urlparse
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException
-from bs4 import BeautifulSoup
 import re
 
 # Import the existing basic crawler
-from payer_portal_crawler import PayerPortalCrawler
+from payer_portal_crawler import PayerPortalCrawler, DEFAULT_PAYER_SETTINGS, extract_links, read_sitemap_pdfs
+
+# pandas is only needed to build the crawl report, so it is imported there
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Keyword template shared by every auto-discovered payer configuration
+AUTO_TARGET_SECTIONS = {
+    "prior_authorization": (
+        "prior authorization", "preauthorization", "pre-auth",
+        "authorization requirements", "auth criteria", "approval"
+    ),
+    "timely_filing": (
+        "timely filing", "claim submission deadlines", 
+        "filing requirements", "submission timelines", "deadline"
+    ),
+    "appeals": (
+        "appeals process", "claim appeals", "dispute resolution",
+        "appeal procedures", "grievances", "complaints"
+    )
+}
+
+
+# Auto-discovery results are reused for this long (seconds) while the CSV is unchanged
+DISCOVERY_CACHE_FILE = ".discovered_configs.json"
+DISCOVERY_CACHE_TTL = 15 * 60
+
+# (connect, read) timeout for portal probes: dead hosts fail fast, slow ones still answer
+PROBE_TIMEOUT = (3, 7)
+
+# Most sitemap-listed PDFs recorded per payer config
+SITEMAP_PDF_LIMIT = 200
+
+# Column order of generate_csv_crawl_report
+REPORT_COLUMNS = (
+    'Company Name', 'Base Domain', 'Priority', 'Market Share (%)',
+    'Crawl Status', 'Links Discovered', 'PDFs Discovered',
+    'PDFs Downloaded', 'Rules Extracted', 'Error Message'
+)
+
+
+@lru_cache(maxsize=1024)
+def host_resolves(host: str) -> bool:
+    """
+    Check (once per process) whether a hostname resolves in DNS
+    
+    Args:
+        host: Hostname such as 'provider.uhc.com'
+        
+    Returns:
+        True if DNS returns at least one address
+    """
+    try:
+        return bool(socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM))
+    except (socket.gaierror, UnicodeError):
+        return False
+
+
+# Runs of characters that cannot appear in a payer key
+NON_KEY_CHARS_RE = re.compile(r'[^a-z0-9]+')
+
+
+@lru_cache(maxsize=1024)
+def payer_key_for(company_name: str) -> str:
+    """
+    Derive the config/results key for a company name (cached per name)
+    
+    Args:
+        company_name: Name as given in the CSV, e.g. 'Blue Cross Blue Shield of Texas'
+        
+    Returns:
+        Lowercase underscore key, e.g. 'blue_cross_blue_shield_of_texas'
+    """
+    return NON_KEY_CHARS_RE.sub('_', company_name.lower()).strip('_')
 
 
 class IntelligentCSVCrawler(PayerPortalCrawler):
@@ -43,18 +118,33 @@ class IntelligentCSVCrawler(PayerPortalCrawler):
     from a CSV file with minimal manual configuration
     """
     
-    def __init__(self, csv_file: str = "payer_companies.csv", **kwargs):
+    def __init__(self, csv_file: str = "payer_companies.csv", discovery_workers: int = 16,
+                 discovery_cache_ttl: float = DISCOVERY_CACHE_TTL,
+                 rows: Optional[Iterable[Dict]] = None, **kwargs):
         """
         Initialize CSV-driven crawler
         
         Args:
             csv_file: Path to CSV file with payer information
-            **kwargs: Additional arguments passed to parent class
+            rows: Payer records (dicts with the CSV's columns) to use instead
+                of reading csv_file
+            discovery_workers: Portal URL probes run concurrently per payer
+            discovery_cache_ttl: Seconds a cached auto-discovery result stays
+                valid (0 disables the cache)
+            **kwargs: Additional arguments passed to parent class (e.g. a
+                shared session, whose pool should fit discovery_workers)
         """
         super().__init__(**kwargs)
         self.csv_file = Path(csv_file)
-        self.payer_df = None
+        self.csv_source = str(self.csv_file) if rows is None else "<rows>"
+        self.payers = []
         self.auto_discovered_configs = {}
+        self.discovery_workers = discovery_workers
+        self.discovery_cache_ttl = discovery_cache_ttl
+        self.discovery_cache_file = Path(DISCOVERY_CACHE_FILE)
+        self._url_validity = {}  # url -> result of check_url_validity
+        self._unreachable_hosts = set()  # (scheme, host) pairs that refused or timed out connecting
+        self._discovery_executor = None  # probe pool, created on first use and kept across payers
         
         # Common provider portal patterns
         self.portal_patterns = [
@@ -81,34 +171,75 @@ class IntelligentCSVCrawler(PayerPortalCrawler):
             "prov"
         ]
         
-        self.load_payer_csv()
+        if rows is None:
+            self.load_payer_csv()
+        else:
+            self.load_payer_rows(rows)
     
     def load_payer_csv(self):
         """Load and validate payer CSV file"""
         try:
-            self.payer_df = pd.read_csv(self.csv_file)
-            self.logger.info(f"Loaded {len(self.payer_df)} payers from {self.csv_file}")
-            
-            # Validate required columns
-            required_columns = ['company_name', 'base_domain']
-            missing_columns = [col for col in required_columns if col not in self.payer_df.columns]
-            
-            if missing_columns:
-                raise ValueError(f"Missing required columns: {missing_columns}")
-            
-            # Add default values for optional columns
-            if 'priority' not in self.payer_df.columns:
-                self.payer_df['priority'] = 'medium'
-            
-            if 'known_provider_portal' not in self.payer_df.columns:
-                self.payer_df['known_provider_portal'] = None
-            
-            self.logger.info(f"CSV validation successful. Ready to process {len(self.payer_df)} payers")
+            # Plain row dicts: the crawler only ever walks the rows in order
+            with open(self.csv_file, newline='', encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
+            self.load_payer_rows(rows)
             
         except Exception as e:
             self.logger.error(f"Failed to load CSV file {self.csv_file}: {e}")
             raise
     
+    def load_payer_rows(self, rows: Iterable[Dict]):
+        """
+        Validate and normalize payer records
+        
+        Args:
+            rows: Dicts with at least 'company_name' and 'base_domain'; the
+                optional columns may be missing, blank or None
+        """
+        # Copy each row so normalizing doesn't rewrite the caller's records
+        self.payers = [dict(row) for row in rows]
+        self.logger.info(f"Loaded {len(self.payers)} payers from {self.csv_source}")
+        
+        # Validate required columns
+        required_columns = ['company_name', 'base_domain']
+        missing_columns = sorted({
+            col for row in self.payers for col in required_columns if col not in row
+        })
+        
+        if missing_columns:
+            raise ValueError(f"Missing required columns: {missing_columns}")
+        
+        # Normalize types once here so later passes compare and report
+        # plain values: lowercase priority, float market share, None for blanks.
+        # csv.DictReader fills the cells of short rows with None
+        valid_payers = []
+        for line_number, row in enumerate(self.payers, start=1):
+            row['company_name'] = (row.get('company_name') or '').strip()
+            row['base_domain'] = (row.get('base_domain') or '').strip().lower()
+            if not row['company_name'] or not row['base_domain']:
+                self.logger.warning(f"Skipping payer row {line_number}: company_name and base_domain are required")
+                continue
+            
+            row['priority'] = (row.get('priority') or '').strip().lower() or 'medium'
+            row['known_provider_portal'] = (row.get('known_provider_portal') or '').strip() or None
+            row['market_share'] = self._parse_market_share(row.get('market_share'))
+            valid_payers.append(row)
+        self.payers = valid_payers
+        
+        self.logger.info(f"CSV validation successful. Ready to process {len(self.payers)} payers")
+    
+    def _parse_market_share(self, value) -> Optional[float]:
+        """Parse a market share value (14.2, '14.2', '14.2%', blank) into a float"""
+        if value is None or value == '':
+            return None
+        if isinstance(value, (int, float)):
+            return float(value)
+        try:
+            return float(value.strip().rstrip('%'))
+        except ValueError:
+            self.logger.warning(f"Ignoring unparseable market share: {value!r}")
+            return None
+    
     def discover_provider_portal(self, company_name: str, base_domain: str, known_portal: str = None) -> List[str]:
         """
         Intelligently discover provider portal URLs for a company
@@ -124,33 +255,34 @@ class IntelligentCSVCrawler(PayerPortalCrawler):
         discovered_urls = []
         
         # If we have a known portal, use it first
-        if known_portal and pd.notna(known_portal):
+        if known_portal:
             discovered_urls.append(known_portal)
             self.logger.info(f"Using known portal for {company_name}: {known_portal}")
         
         # Auto-discovery strategies
         base_url = f"https://www.{base_domain}" if not base_domain.startswith('http') else base_domain
         
-        # Strategy 1: Common provider portal patterns
-        for pattern in self.portal_patterns:
-            candidate_urls = [
+        # Strategies 1 and 2: common provider portal paths and subdomains.
+        # The probes are independent HEAD requests, so they run concurrently;
+        # results come back in candidate order.
+        candidate_urls = [
+            url
+            for pattern in self.portal_patterns
+            for url in (
                 f"{base_url}/{pattern}/",
                 f"{base_url}/{pattern}.html",
                 f"{base_url}/en/{pattern}/",
                 f"{base_url}/en/{pattern}.html"
-            ]
-            
-            for url in candidate_urls:
-                if self.check_url_validity(url):
-                    discovered_urls.append(url)
-                    self.logger.info(f"Discovered portal for {company_name}: {url}")
+            )
+        ]
+        candidate_urls.extend(f"https://{subdomain}.{base_domain}/" for subdomain in self.portal_subdomains)
+        candidate_urls = list(dict.fromkeys(candidate_urls))
         
-        # Strategy 2: Common provider subdomains
-        for subdomain in self.portal_subdomains:
-            subdomain_url = f"https://{subdomain}.{base_domain}/"
-            if self.check_url_validity(subdomain_url):
-                discovered_urls.append(subdomain_url)
-                self.logger.info(f"Discovered subdomain portal for {company_name}: {subdomain_url}")
+        validity = self._get_discovery_executor().map(self.check_url_validity, candidate_urls)
+        for url, is_valid in zip(candidate_urls, validity):
+            if is_valid:
+                discovered_urls.append(url)
+                self.logger.debug("Discovered portal for %s: %s", company_name, url)
         
         # Strategy 3: Search main website for provider links
         main_page_portals = self.search_main_page_for_portals(base_url)
@@ -167,6 +299,15 @@ class IntelligentCSVCrawler(PayerPortalCrawler):
         self.logger.info(f"Total discovered URLs for {company_name}: {len(unique_urls)}")
         return unique_urls
     
+    def _get_discovery_executor(self) -> ThreadPoolExecutor:
+        """Return the probe thread pool, starting it on first use"""
+        if self._discovery_executor is None:
+            self._discovery_executor = ThreadPoolExecutor(
+                max_workers=self.discovery_workers,
+                thread_name_prefix="discovery"
+            )
+        return self._discovery_executor
+    
     def check_url_validity(self, url: str) -> bool:
         """
         Check if a URL is valid and accessible
@@ -177,12 +318,26 @@ class IntelligentCSVCrawler(PayerPortalCrawler):
         Returns:
             True if URL is valid and accessible
         """
+        # Payers sharing hosts (and repeat discovery runs) probe the same URLs
+        if url not in self._url_validity:
+            self._url_validity[url] = self._probe_url(url)
+        return self._url_validity[url]
+    
+    def _probe_url(self, url: str) -> bool:
+        """Send the HEAD probe behind check_url_validity"""
+        # Guessed subdomains often don't exist; skip the request when DNS says so
+        parsed = urlparse(url)
+        host_key = (parsed.scheme, parsed.hostname or '')
+        if host_key in self._unreachable_hosts or not host_resolves(host_key[1]):
+            return False
+        
+        request_url = url
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.head(url, headers=headers, timeout=10, allow_redirects=True)
+            # Most candidates answer directly; only follow when redirected
+            response = self.session.head(url, timeout=PROBE_TIMEOUT, allow_redirects=False)
+            if response.is_redirect:
+                request_url = urljoin(url, response.headers['location'])
+                response = self.session.head(request_url, timeout=PROBE_TIMEOUT, allow_redirects=True)
             
             # Consider 2xx and 3xx status codes as valid
             if 200 <= response.status_code < 400:
@@ -190,6 +345,15 @@ class IntelligentCSVCrawler(PayerPortalCrawler):
             
             return False
             
+        except requests.ConnectionError as e:
+            # A host that resolves but won't connect (ConnectTimeout included) fails
+            # every path the same way. Blame the host the failing request went to,
+            # which after a redirect is not the candidate's own host. A read timeout
+            # is only one slow response and fails just this URL.
+            failed_url = e.request.url if e.request is not None else request_url
+            failed = urlparse(failed_url)
+            self._unreachable_hosts.add((failed.scheme, failed.hostname or ''))
+            return False
         except Exception:
             return False
     
@@ -206,10 +370,21 @@ class IntelligentCSVCrawler(PayerPortalCrawler):
         portal_urls = []
         
         try:
-            self.driver.get(base_url)
-            time.sleep(3)  # Allow page to load
-            
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            page = self._fetch_static_html(base_url) if self.fast_path else None
+            if page is not None:
+                html_content = page[0]
+            else:
+                driver = self._get_driver()
+                driver.get(base_url)
+                
+                # Wait for links to render instead of a fixed sleep
+                try:
+                    WebDriverWait(driver, 8).until(
+                        EC.presence_of_all_elements_located((By.TAG_NAME, "a"))
+                    )
+                except TimeoutException:
+                    self.logger.warning(f"No links rendered on {base_url} within timeout")
+                html_content = driver.page_source
             
             # Look for links containing provider-related keywords
             provider_keywords = [
@@ -217,11 +392,8 @@ class IntelligentCSVCrawler(PayerPortalCrawler):
                 'practitioner', 'health care professional', 'medical professional'
             ]
             
-            links = soup.find_all('a', href=True)
-            
-            for link in links:
-                href = link['href']
-                text = link.get_text(strip=True).lower()
+            for href, text in extract_links(html_content):
+                text = text.lower()
                 
                 # Check if link text contains provider keywords
                 if any(keyword in text for keyword in provider_keywords):
@@ -232,13 +404,49 @@ class IntelligentCSVCrawler(PayerPortalCrawler):
                     parsed = urlparse(absolute_url)
                     if parsed.netloc and parsed.scheme in ['http', 'https']:
                         portal_urls.append(absolute_url)
-                        self.logger.info(f"Found provider link on main page: {absolute_url}")
+                        self.logger.debug("Found provider link on main page: %s", absolute_url)
             
         except Exception as e:
             self.logger.warning(f"Failed to search main page {base_url}: {e}")
         
         return portal_urls
     
+    def discover_sitemap_pdfs(self, base_domain: str, starting_urls: List[str]) -> List[str]:
+        """
+        Collect PDF URLs the payer publishes in its sitemaps
+        
+        One robots.txt/sitemap read per host can list PDFs that would take
+        dozens of page fetches to find by link crawling. The result only adds
+        to the PDF candidates (download_pdfs still crawls the portal pages).
+        
+        Args:
+            base_domain: Base domain (e.g., 'uhc.com')
+            starting_urls: Discovered portal URLs; their hosts are read too
+            
+        Returns:
+            Up to SITEMAP_PDF_LIMIT PDF URLs on the payer's domain
+        """
+        hosts = list(dict.fromkeys(
+            [f"www.{base_domain}"] +
+            [(urlparse(url).hostname or '').lower() for url in starting_urls]
+        ))
+        hosts = [host for host in hosts if host and host_resolves(host)]
+        
+        pdf_urls = []
+        per_host = self._get_discovery_executor().map(
+            lambda host: read_sitemap_pdfs(self.session, host), hosts
+        )
+        for host_pdfs in per_host:
+            for url in host_pdfs:
+                host = (urlparse(url).hostname or '').lower()
+                if host == base_domain or host.endswith('.' + base_domain):
+                    pdf_urls.append(url)
+        
+        pdf_urls = list(dict.fromkeys(pdf_urls))[:SITEMAP_PDF_LIMIT]
+        if pdf_urls:
+            self.logger.info(f"Found {len(pdf_urls)} PDFs in sitemaps for {base_domain}")
+        return pdf_urls
+    
     def generate_auto_config(self, company_name: str, base_domain: str, discovered_urls: List[str]) -> Dict:
         """
         Generate automatic configuration for a payer
@@ -252,8 +460,7 @@ class IntelligentCSVCrawler(PayerPortalCrawler):
             Payer configuration dictionary
         """
         # Clean company name for use as key
-        payer_key = re.sub(r'[^a-zA-Z0-9]', '_', company_name.lower())
-        payer_key = re.sub(r'_+', '_', payer_key).strip('_')
+        payer_key = payer_key_for(company_name)
         
         # Determine allowed domains
         allowed_domains = [base_domain]
@@ -267,43 +474,91 @@ class IntelligentCSVCrawler(PayerPortalCrawler):
             allowed_domains.append(f"{subdomain}.{base_domain}")
         
         config = {
+            **DEFAULT_PAYER_SETTINGS,
             "name": company_name,
             "base_url": f"https://www.{base_domain}",
             "starting_urls": discovered_urls[:5],  # Limit to top 5 URLs
             "allowed_domains": allowed_domains,
-            "target_sections": {
-                "prior_authorization": [
-                    "prior authorization", "preauthorization", "pre-auth",
-                    "authorization requirements", "auth criteria", "approval"
-                ],
-                "timely_filing": [
-                    "timely filing", "claim submission deadlines", 
-                    "filing requirements", "submission timelines", "deadline"
-                ],
-                "appeals": [
-                    "appeals process", "claim appeals", "dispute resolution",
-                    "appeal procedures", "grievances", "complaints"
-                ]
-            },
-            "rate_limit": 2,
+            "target_sections": AUTO_TARGET_SECTIONS,
             "auto_discovered": True,
             "discovery_timestamp": datetime.now().isoformat()
         }
         
         return payer_key, config
     
-    def auto_discover_all_payers(self) -> Dict:
+    def _csv_fingerprint(self) -> str:
+        """SHA-256 of the loaded payer rows, so any CSV edit invalidates cached discovery"""
+        return hashlib.sha256(
+            orjson.dumps(self.payers, option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()
+    
+    def _load_discovery_cache(self) -> Optional[Dict]:
+        """
+        Load cached auto-discovery results if they are fresh
+        
+        Returns:
+            The cached payer configurations, or None if the cache is missing,
+            older than discovery_cache_ttl, or built from a different CSV
+        """
+        try:
+            age = time.time() - self.discovery_cache_file.stat().st_mtime
+            if age >= self.discovery_cache_ttl:
+                return None
+            cached = orjson.loads(self.discovery_cache_file.read_bytes())
+        except (OSError, ValueError):
+            return None
+        
+        if cached.get('csv_sha256') != self._csv_fingerprint():
+            return None
+        return cached.get('payer_configurations')
+    
+    def _save_discovery_cache(self, configs: Dict):
+        """Write auto-discovery results to the cache file atomically"""
+        cache_data = {
+            'csv_source': self.csv_source,
+            'csv_sha256': self._csv_fingerprint(),
+            'payer_configurations': configs
+        }
+        
+        # Write beside the target and swap in, so a crash never leaves half a file
+        temp_file = self.discovery_cache_file.with_name(self.discovery_cache_file.name + '.tmp')
+        try:
+            temp_file.write_bytes(orjson.dumps(cache_data))
+            os.replace(temp_file, self.discovery_cache_file)
+        except OSError as e:
+            self.logger.warning(f"Failed to write discovery cache {self.discovery_cache_file}: {e}")
+    
+    def auto_discover_all_payers(self, force_refresh: bool = False) -> Dict:
         """
         Automatically discover configurations for all payers in CSV
         
+        Args:
+            force_refresh: Ignore cached discovery results and probe every portal again
+        
         Returns:
             Dictionary of auto-discovered payer configurations
         """
+        if not force_refresh and self.discovery_cache_ttl > 0:
+            cached_configs = self._load_discovery_cache()
+            if cached_configs is not None:
+                self.logger.info(f"Using cached auto-discovery for {len(cached_configs)} payers from {self.discovery_cache_file}")
+                self.auto_discovered_configs = cached_configs
+                return cached_configs
+        
         self.logger.info("Starting auto-discovery for all payers in CSV")
         
+        # Resolve every host discovery may probe up front, in parallel,
+        # so the per-payer probes hit a warm cache
+        hosts = {
+            f"{prefix}.{base_domain}"
+            for base_domain in (row['base_domain'] for row in self.payers)
+            for prefix in ('www', *self.portal_subdomains)
+        }
+        list(self._get_discovery_executor().map(host_resolves, hosts))
+        
         discovered_configs = {}
         
-        for idx, row in self.payer_df.iterrows():
+        for row in self.payers:
             company_name = row['company_name']
             base_domain = row['base_domain']
             known_portal = row.get('known_provider_portal')
@@ -326,6 +581,9 @@ class IntelligentCSVCrawler(PayerPortalCrawler):
                     payer_key, config = self.generate_auto_config(
                         company_name, base_domain, discovered_urls
                     )
+                    config['sitemap_pdf_urls'] = self.discover_sitemap_pdfs(
+                        base_domain, config['starting_urls']
+                    )
                     
                     discovered_configs[payer_key] = config
                     self.logger.info(f"Successfully configured {company_name} with {len(discovered_urls)} URLs")
@@ -339,6 +597,8 @@ class IntelligentCSVCrawler(PayerPortalCrawler):
                 self.logger.error(f"Failed to auto-discover {company_name}: {e}")
         
         self.auto_discovered_configs = discovered_configs
+        if self.discovery_cache_ttl > 0:
+            self._save_discovery_cache(discovered_configs)
         self.logger.info(f"\\nAuto-discovery completed: {len(discovered_configs)} payers configured")
         
         return discovered_configs
@@ -357,20 +617,32 @@ class IntelligentCSVCrawler(PayerPortalCrawler):
             self.logger.info("No auto-discovered configs found. Running auto-discovery first...")
             self.auto_discover_all_payers()
         
-        # Filter by priority if specified
+        # Filter by priority if specified (row priorities are lowercased at load)
+        if priority_filter is not None:
+            priority_filter = priority_filter.lower()
         filtered_payers = {}
         
-        for idx, row in self.payer_df.iterrows():
+        for row in self.payers:
             company_name = row['company_name']
-            priority = row.get('priority', 'medium')
             
-            if priority_filter is None or priority.lower() == priority_filter.lower():
+            if priority_filter is None or row['priority'] == priority_filter:
                 # Find matching config
-                payer_key = re.sub(r'[^a-zA-Z0-9]', '_', company_name.lower())
-                payer_key = re.sub(r'_+', '_', payer_key).strip('_')
+                payer_key = payer_key_for(company_name)
                 
                 if payer_key in self.auto_discovered_configs:
-                    filtered_payers[payer_key] = self.auto_discovered_configs[payer_key]
+                    config = self.auto_discovered_configs[payer_key]
+                    # crawl_payer starts from provider_portal: the best-ranked discovered URL
+                    filtered_payers[payer_key] = {
+                        **config,
+                        'provider_portal': (config.get('starting_urls') or [config['base_url']])[0]
+                    }
+        
+        # Crawl payers that start on the same host back to back, so the shared
+        # session's keep-alive connections are reused instead of re-handshaking
+        filtered_payers = dict(sorted(
+            filtered_payers.items(),
+            key=lambda item: urlparse(item[1]['provider_portal']).netloc.lower()
+        ))
         
         self.logger.info(f"Crawling {len(filtered_payers)} payers with priority: {priority_filter or 'all'}")
         
@@ -379,9 +651,8 @@ class IntelligentCSVCrawler(PayerPortalCrawler):
         self.payer_configs = filtered_payers
         
         try:
-            # Run BFS crawling
-            results = self.crawl_all_payers_bfs()
-            return results
+            # crawl_all_payers visits payer_configs in order, keeping the host grouping
+            return self.crawl_all_payers()
         finally:
             # Restore original configs
             self.payer_configs = original_configs
@@ -397,20 +668,20 @@ class IntelligentCSVCrawler(PayerPortalCrawler):
         config_data = {
             'discovery_timestamp': datetime.now().isoformat(),
             'total_payers_discovered': len(self.auto_discovered_configs),
-            'csv_source': str(self.csv_file),
+            'csv_source': self.csv_source,
             'payer_configurations': self.auto_discovered_configs
         }
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2, ensure_ascii=False)
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(config_data, option=orjson.OPT_INDENT_2))
             
             self.logger.info(f"Auto-discovered configs saved to: {filepath}")
             
         except Exception as e:
             self.logger.error(f"Failed to save configs to {filepath}: {e}")
     
-    def generate_csv_crawl_report(self, results: Dict) -> pd.DataFrame:
+    def generate_csv_crawl_report(self, results: Dict) -> 'pd.DataFrame':
         """
         Generate a comprehensive report of crawling results in CSV format
         
@@ -424,15 +695,14 @@ class IntelligentCSVCrawler(PayerPortalCrawler):
         
         payer_results = results.get('payer_results', {})
         
-        for idx, row in self.payer_df.iterrows():
+        for row in self.payers:
             company_name = row['company_name']
             base_domain = row['base_domain']
-            priority = row.get('priority', 'medium')
-            market_share = row.get('market_share', 'N/A')
+            priority = row['priority']
+            market_share = row['market_share'] if row['market_share'] is not None else 'N/A'
             
             # Find matching results
-            payer_key = re.sub(r'[^a-zA-Z0-9]', '_', company_name.lower())
-            payer_key = re.sub(r'_+', '_', payer_key).strip('_')
+            payer_key = payer_key_for(company_name)
             
             payer_result = payer_results.get(payer_key, {})
             
@@ -467,7 +737,16 @@ class IntelligentCSVCrawler(PayerPortalCrawler):
                 'Error Message': error_message
             })
         
-        return pd.DataFrame(report_data)
+        import pandas as pd
+        
+        return pd.DataFrame.from_records(report_data, columns=REPORT_COLUMNS)
+    
+    def close(self):
+        """Clean up resources, including the discovery thread pool"""
+        if self._discovery_executor is not None:
+            self._discovery_executor.shutdown(wait=True)
+            self._discovery_executor = None
+        super().close()
 
 
 def main():
@@ -480,6 +759,8 @@ def main():
     parser.add_argument('--discover-only', action='store_true', help='Only run auto-discovery, no crawling')
     parser.add_argument('--max-depth', type=int, default=3, help='Maximum BFS depth')
     parser.add_argument('--headless', action='store_true', help='Run in headless mode')
+    parser.add_argument('--refresh-discovery', action='store_true', help='Ignore cached auto-discovery results')
+    parser.add_argument('--browser-only', action='store_true', help='Load every page in Chrome instead of trying plain HTTP first')
     parser.add_argument('--output', type=str, default='csv_crawl_results.json', help='Output filename')
     
     args = parser.parse_args()
@@ -488,6 +769,7 @@ def main():
     crawler = IntelligentCSVCrawler(
         csv_file=args.csv,
         headless=args.headless,
+        fast_path=not args.browser_only,
         max_depth=args.max_depth
     )
     
@@ -495,7 +777,7 @@ def main():
         if args.discover_only:
             # Only run auto-discovery
             print(f"Running auto-discovery for payers in {args.csv}...")
-            configs = crawler.auto_discover_all_payers()
+            configs = crawler.auto_discover_all_payers(force_refresh=args.refresh_discovery)
             crawler.save_discovered_configs()
             print(f"Auto-discovery completed! Found configurations for {len(configs)} payers")
         else:
@@ -506,7 +788,7 @@ def main():
             print(f"Max depth: {args.max_depth}")
             
             # Auto-discover configurations
-            crawler.auto_discover_all_payers()
+            crawler.auto_discover_all_payers(force_refresh=args.refresh_discovery)
             crawler.save_discovered_configs()
             
             # Run crawling
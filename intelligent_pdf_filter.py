@@ -16,16 +16,11 @@ Date: October 2025
 
 import os
 import re
-import hashlib
 import logging
-from pathlib import Path
-from urllib.parse import urlparse
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Dict, List, Tuple
 import requests
 import fitz  # PyMuPDF
-import json
-from datetime import datetime
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import difflib
 
 class IntelligentPDFFilter:
@@ -88,6 +83,13 @@ class IntelligentPDFFilter:
             r'draft - not for distribution'
         ]
         
+        # Compiled once: each URL runs one union search, and only URLs that hit
+        # it are scored pattern by pattern (patterns overlap, so counts need each)
+        self._high_value_url_res = [(p, re.compile(p)) for p in self.high_value_url_patterns]
+        self._low_value_url_res = [(p, re.compile(p)) for p in self.low_value_url_patterns]
+        self._any_url_pattern_re = re.compile('|'.join(self.high_value_url_patterns + self.low_value_url_patterns))
+        self._exclusion_content_re = re.compile('|'.join(self.exclusion_content_patterns))
+        
         # Quality thresholds
         self.min_content_length = 500  # Minimum meaningful content
         self.max_content_length = 1000000  # Maximum to avoid huge documents
@@ -109,26 +111,18 @@ class IntelligentPDFFilter:
         Returns:
             (score, reason) where score > 0 is relevant
         """
+        # The filename is part of the lowercased URL, so searching the URL covers both
         url_lower = url.lower()
-        filename = os.path.basename(urlparse(url).path).lower()
+        if not self._any_url_pattern_re.search(url_lower):
+            return 0, "Neutral URL pattern"
         
         # Check for high-value patterns
-        high_value_score = 0
-        high_value_matches = []
-        
-        for pattern in self.high_value_url_patterns:
-            if re.search(pattern, url_lower) or re.search(pattern, filename):
-                high_value_score += 2
-                high_value_matches.append(pattern)
+        high_value_matches = [p for p, regex in self._high_value_url_res if regex.search(url_lower)]
+        high_value_score = 2 * len(high_value_matches)
         
         # Check for low-value patterns
-        low_value_score = 0
-        low_value_matches = []
-        
-        for pattern in self.low_value_url_patterns:
-            if re.search(pattern, url_lower) or re.search(pattern, filename):
-                low_value_score += 1
-                low_value_matches.append(pattern)
+        low_value_matches = [p for p, regex in self._low_value_url_res if regex.search(url_lower)]
+        low_value_score = len(low_value_matches)
         
         # Calculate final score
         final_score = high_value_score - low_value_score
@@ -295,10 +289,8 @@ class IntelligentPDFFilter:
         }
         
         # Check for exclusion patterns
-        for pattern in self.exclusion_content_patterns:
-            if re.search(pattern, text):
-                quality_indicators['no_exclusion_patterns'] = False
-                break
+        if self._exclusion_content_re.search(text):
+            quality_indicators['no_exclusion_patterns'] = False
         
         # Relevance indicators
         relevance_score = 0
@@ -376,10 +368,61 @@ class IntelligentPDFFilter:
         
         return normalized.strip()
     
-    def process_pdf_batch_with_filtering(self, urls: List[str], max_pdfs: int = 20) -> Dict:
+    def _download_and_assess(self, index: int, url: str) -> Dict:
+        """
+        Download one PDF, extract its content and score it
+        
+        Returns:
+            {'content', 'quality_assessment', 'file_size'} on success,
+            or {'error': reason} if the PDF could not be used
+        """
+        self.logger.info(f"Processing PDF {index+1}: {url}")
+        temp_path = f"temp_pdf_{index}.pdf"
+        
+        try:
+            # Download (simplified for this example)
+            with requests.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                
+                # Save temporarily, 64 KB at a time so large manuals never sit in memory;
+                # the byte count doubles as the file size, no stat needed afterwards
+                file_size = 0
+                with open(temp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
+                        file_size += len(chunk)
+            
+            # Extract content
+            content = self.extract_clean_content(temp_path)
+            
+            if not content['extraction_success']:
+                return {'error': f"Extraction failed: {content.get('error', 'Unknown')}"}
+            
+            return {
+                'content': content,
+                'quality_assessment': self.assess_content_quality(content),
+                'file_size': file_size
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Error processing {url}: {e}")
+            return {'error': f"Processing error: {str(e)[:100]}"}
+            
+        finally:
+            # Clean up
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    def process_pdf_batch_with_filtering(self, urls: List[str], max_pdfs: int = 20,
+                                         max_workers: int = 4) -> Dict:
         """
         Process a batch of PDFs with comprehensive filtering
         
+        Args:
+            urls: Candidate PDF URLs
+            max_pdfs: Maximum number of URL-accepted PDFs to download
+            max_workers: Number of PDFs downloaded and extracted concurrently
+        
         Returns:
             Comprehensive results with filtering decisions
         """
@@ -405,67 +448,45 @@ class IntelligentPDFFilter:
             'processing_log': []
         }
         
+        # Download, extraction and scoring are independent per URL, so they
+        # run concurrently; duplicate detection below stays sequential and in
+        # input order so results don't depend on which download finishes first
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            processed = list(executor.map(
+                self._download_and_assess, range(len(processing_urls)), processing_urls
+            ))
+        
         existing_contents = []
         
-        for i, url in enumerate(processing_urls):
-            self.logger.info(f"Processing PDF {i+1}/{len(processing_urls)}: {url}")
+        for url, outcome in zip(processing_urls, processed):
+            if 'error' in outcome:
+                results['final_rejected'] += 1
+                results['rejected_reasons'].append(outcome['error'])
+                continue
             
-            try:
-                # Download (simplified for this example)
-                response = requests.get(url, timeout=30, stream=True)
-                response.raise_for_status()
-                
-                # Save temporarily
-                temp_path = f"temp_pdf_{i}.pdf"
-                with open(temp_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                
-                # Extract content
-                content = self.extract_clean_content(temp_path)
-                
-                if not content['extraction_success']:
-                    results['final_rejected'] += 1
-                    results['rejected_reasons'].append(f"Extraction failed: {content.get('error', 'Unknown')}")
-                    os.remove(temp_path)
-                    continue
-                
-                # Assess quality
-                quality_assessment = self.assess_content_quality(content)
-                
-                # Check for duplicates
-                is_duplicate, similarity, dup_index = self.detect_content_similarity(
-                    content['full_text'], existing_contents
-                )
-                
-                if is_duplicate:
-                    results['duplicates_removed'] += 1
-                    results['rejected_reasons'].append(f"Duplicate content (similarity: {similarity:.2f})")
-                    os.remove(temp_path)
-                    continue
-                
-                # Make final decision
-                if quality_assessment['recommendation'] == 'accept':
-                    results['final_accepted'] += 1
-                    results['accepted_content'][url] = {
-                        'content': content,
-                        'quality_assessment': quality_assessment,
-                        'file_size': os.path.getsize(temp_path)
-                    }
-                    existing_contents.append(content['full_text'])
-                    self.logger.info(f"✓ ACCEPTED: {quality_assessment['reason']}")
-                else:
-                    results['final_rejected'] += 1
-                    results['rejected_reasons'].append(quality_assessment['reason'])
-                    self.logger.info(f"✗ REJECTED: {quality_assessment['reason']}")
-                
-                # Clean up
-                os.remove(temp_path)
-                
-            except Exception as e:
+            content = outcome['content']
+            quality_assessment = outcome['quality_assessment']
+            
+            # Check for duplicates
+            is_duplicate, similarity, dup_index = self.detect_content_similarity(
+                content['full_text'], existing_contents
+            )
+            
+            if is_duplicate:
+                results['duplicates_removed'] += 1
+                results['rejected_reasons'].append(f"Duplicate content (similarity: {similarity:.2f})")
+                continue
+            
+            # Make final decision
+            if quality_assessment['recommendation'] == 'accept':
+                results['final_accepted'] += 1
+                results['accepted_content'][url] = outcome
+                existing_contents.append(content['full_text'])
+                self.logger.info(f"✓ ACCEPTED: {quality_assessment['reason']}")
+            else:
                 results['final_rejected'] += 1
-                results['rejected_reasons'].append(f"Processing error: {str(e)[:100]}")
-                self.logger.error(f"Error processing {url}: {e}")
+                results['rejected_reasons'].append(quality_assessment['reason'])
+                self.logger.info(f"✗ REJECTED: {quality_assessment['reason']}")
         
         return results
 
@@ -19,58 +19,413 @@ Date: October 2025
 """
 
 import time
-import json
-import pandas as pd
-from datetime import datetime, timedelta
+import atexit
+import gzip
+import hashlib
+import threading
+import orjson
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import logging
+import logging.handlers
 
 # Selenium imports
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import TimeoutException
 
 # BeautifulSoup for HTML parsing
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# PDF processing
-import PyPDF2
+# PDF processing (PyPDF2 is imported only if a PyMuPDF extraction fails)
 import fitz  # PyMuPDF for better PDF extraction
 
 # Data processing
 import re
 import os
+import sys
+from bisect import bisect_right
+from xml.etree import ElementTree
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse
 
 
+# Settings shared by every payer configuration; entries only spell out what differs
+DEFAULT_PAYER_SETTINGS = {
+    "login_required": False,  # Start with public areas
+    "rate_limit": 2  # seconds between requests
+}
+
+
+# Static payer portal configurations, built once at import and shared by all crawlers.
+# Keyword groups are tuples so the shared structure can't be mutated in place.
+PAYER_CONFIGURATIONS = {
+    "united_healthcare": {
+        **DEFAULT_PAYER_SETTINGS,
+        "name": "United Healthcare",
+        "base_url": "https://www.uhcprovider.com/",
+        "provider_portal": "https://www.uhcprovider.com/en/resource-library.html",
+        "additional_pages": [
+            "https://www.uhcprovider.com/en/policies-protocols.html",
+            "https://www.uhcprovider.com/en/prior-authorization.html",
+            "https://www.uhcprovider.com/en/claims-payments.html"
+        ],
+        "target_sections": {
+            "prior_authorization": (
+                "prior authorization", "preauthorization", "pre-auth",
+                "authorization requirements", "auth criteria"
+            ),
+            "timely_filing": (
+                "timely filing", "claim submission deadlines", 
+                "filing requirements", "submission timelines"
+            ),
+            "appeals": (
+                "appeals process", "claim appeals", "dispute resolution",
+                "appeal procedures", "grievances"
+            )
+        }
+    },
+    
+    "anthem": {
+        **DEFAULT_PAYER_SETTINGS,
+        "name": "Anthem/Elevance Health",
+        "base_url": "https://providers.anthem.com/",
+        "provider_portal": "https://providers.anthem.com/docs/gpp/",
+        "direct_pdf_urls": [
+            "https://files.providernews.anthem.com/1661/2022-Provider-Manual-pages-44-113.pdf",
+            "https://providers.anthem.com/docs/gpp/OH_CAID_ProviderManual.pdf?v=202210032112",
+            "https://providers.anthem.com/docs/gpp/NY_ABC_CAID_ProviderManual.pdf?v=202501161732",
+            "https://providers.anthem.com/docs/gpp/OH_CAID_ClaimsEscalation.pdf",
+            "https://providers.anthem.com/docs/gpp/NV_CAID_PriorAuthreq006648-22.pdf",
+            "https://providers.anthem.com/docs/gpp/VA_CAID_ProviderManual.pdf?v=202105212022",
+            "https://providers.anthem.com/docs/gpp/california-provider/CA_CAID_ProviderManual.pdf",
+            "https://providers.anthem.com/docs/gpp/WI_CAID_Provider_Manual.pdf?v=202504111439"
+        ],
+        "additional_pages": [
+            "https://www.anthem.com/provider/forms/",
+            "https://www.anthem.com/provider/individual-commercial/prior-authorization/"
+        ],
+        "target_sections": {
+            "prior_authorization": (
+                "prior authorization", "preauthorization", "medical necessity",
+                "authorization lists", "pre-auth requirements"
+            ),
+            "timely_filing": (
+                "timely filing", "claim deadlines", "filing limits",
+                "submission requirements", "billing deadlines"
+            ),
+            "appeals": (
+                "appeals", "claim disputes", "grievance procedures",
+                "appeal guidelines", "dispute resolution"
+            )
+        }
+    },
+    
+    "aetna": {
+        **DEFAULT_PAYER_SETTINGS,
+        "name": "Aetna",
+        "base_url": "https://www.aetna.com/",
+        "provider_portal": "https://www.aetna.com/health-care-professionals.html",
+        "additional_pages": [
+            "https://www.aetna.com/health-care-professionals/provider-education-center.html",
+            "https://www.aetna.com/health-care-professionals/clinical-policy-bulletins.html",
+            "https://www.aetna.com/health-care-professionals/claims-payment.html"
+        ],
+        "target_sections": {
+            "prior_authorization": (
+                "prior authorization", "preauthorization", "pre-auth",
+                "authorization requirements", "medical review"
+            ),
+            "timely_filing": (
+                "timely filing", "claim submission", "filing deadlines",
+                "billing requirements", "submission timelines"
+            ),
+            "appeals": (
+                "appeals process", "claim appeals", "disputes",
+                "appeal procedures", "grievance process"
+            )
+        }
+    }
+}
+
+
+# Page subresources the browser never needs to fetch while crawling
+BLOCKED_RESOURCE_PATTERNS = (
+    '*.css', '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.mp4', '*.webm'
+)
+
+
+# Headers for PDF downloads, on top of the session's browser User-Agent
+PDF_REQUEST_HEADERS = {
+    'Accept': 'application/pdf,application/octet-stream,*/*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+
+def create_http_session(pool_size: int = 16, retries: int = 1) -> requests.Session:
+    """
+    Create a keep-alive HTTP session that crawlers can share
+    
+    Args:
+        pool_size: Connections kept open per host (size it to the number
+            of threads using the session)
+        retries: Times a dropped connection or read error is retried, with a
+            short backoff, before the request fails
+        
+    Returns:
+        Session with a browser User-Agent and a pooled adapter mounted
+    """
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    })
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=retries, backoff_factor=0.2)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Rule phrases per rule type, each compiled into its own pattern at import.
+# A rule runs from the phrase to the next blank line or capitalised line.
+# Phrases are kept apart rather than joined into one alternation: finditer
+# does not return overlapping matches, so an alternation would drop rules
+# that start inside another phrase's match.
+_RULE_END = r'.*?(?=\n\n|\n[A-Z]|$)'
+_RULE_PHRASES = {
+    'prior_authorization': (
+        r'prior authorization',
+        r'preauthorization',
+        r'authorization required'
+    ),
+    'timely_filing': (
+        r'timely filing',
+        r'filing deadline',
+        r'submit.*?within.*?days'
+    ),
+    'appeals': (
+        r'appeal.*?process',
+        r'grievance.*?procedure',
+        r'dispute.*?resolution'
+    )
+}
+RULE_PATTERNS = {
+    rule_type: tuple(
+        re.compile(phrase + _RULE_END, re.IGNORECASE | re.DOTALL)
+        for phrase in phrases
+    )
+    for rule_type, phrases in _RULE_PHRASES.items()
+}
+
+
+# Phrases that mark page text as an actual rule rather than a passing mention
+RULE_INDICATORS = {
+    'prior_authorization': (
+        'must obtain', 'requires authorization', 'prior approval',
+        'pre-authorization required', 'contact for auth'
+    ),
+    'timely_filing': (
+        'days from', 'within', 'deadline', 'filing limit',
+        'submit by', 'time limit'
+    ),
+    'appeals': (
+        'appeal within', 'dispute process', 'grievance procedure',
+        'appeal deadline', 'contact to appeal'
+    )
+}
+
+
+# Geographic identifiers, matched against lowercased PDF text
+STATE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'(alabama|alaska|arizona|arkansas|california|colorado|connecticut|delaware|florida|georgia|hawaii|idaho|illinois|indiana|iowa|kansas|kentucky|louisiana|maine|maryland|massachusetts|michigan|minnesota|mississippi|missouri|montana|nebraska|nevada|new hampshire|new jersey|new mexico|new york|north carolina|north dakota|ohio|oklahoma|oregon|pennsylvania|rhode island|south carolina|south dakota|tennessee|texas|utah|vermont|virginia|washington|west virginia|wisconsin|wyoming)',
+    r'(al|ak|az|ar|ca|co|ct|de|fl|ga|hi|id|il|in|ia|ks|ky|la|me|md|ma|mi|mn|ms|mo|mt|ne|nv|nh|nj|nm|ny|nc|nd|oh|ok|or|pa|ri|sc|sd|tn|tx|ut|vt|va|wa|wv|wi|wy)'
+))
+REGION_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'region\s+\d+',
+    r'zone\s+[a-z0-9]+',
+    r'area\s+[a-z0-9]+',
+    r'network\s+[a-z0-9]+',
+    r'service\s+area'
+))
+
+# Bump whenever _extract_pdf_content's output changes (rule/zone patterns, page
+# joining, ...) so extractions cached by content hash are redone
+EXTRACTION_CACHE_VERSION = 2
+
+# A static response with no <a href> is an app shell whose links are drawn by JavaScript.
+# Only a cheap first check: most app shells still carry nav, footer or skip links
+STATIC_ANCHOR_RE = re.compile(r'<a\s[^>]*?href\s*=', re.I)
+
+# Link keywords, each set compiled to one case-insensitive alternation
+RELEVANT_LINK_RE = re.compile(
+    'prior auth|authorization|timely filing|appeals|provider|manual|guideline|'
+    'policy|procedure|claim|billing|reimbursement|coverage',
+    re.I
+)
+DOCUMENT_HREF_RE = re.compile(r'\.docx?|\.pdf', re.I)
+LINK_TYPE_PATTERNS = (
+    ('prior_authorization', re.compile('prior auth|authorization', re.I)),
+    ('timely_filing', re.compile('timely filing|deadline', re.I)),
+    ('appeals', re.compile('appeal|dispute', re.I)),
+    ('manual', re.compile('manual|guide', re.I))
+)
+
+# Rule sections counted per payer by generate_summary_report, as (section, summary key prefix)
+SUMMARY_RULE_SECTIONS = (
+    ('prior_authorization', 'prior_auth'),
+    ('timely_filing', 'timely_filing'),
+    ('appeals', 'appeals')
+)
+
+# Parse filter that builds only the <a href> elements of a page
+ANCHOR_STRAINER = SoupStrainer('a', href=True)
+
+
+def extract_links(html: str) -> List[Tuple[str, str]]:
+    """
+    Pull every link out of an HTML page
+    
+    Only the anchors are built, with the C-backed lxml parser, which is
+    much cheaper than a full html.parser tree when links are all a caller
+    needs.
+    
+    Args:
+        html: Page markup
+        
+    Returns:
+        (href, text) pairs in document order, text stripped
+    """
+    soup = BeautifulSoup(html, 'lxml', parse_only=ANCHOR_STRAINER)
+    return [(link['href'], link.get_text(strip=True)) for link in soup.find_all('a', href=True)]
+
+
+def read_sitemap_pdfs(session: requests.Session, host: str, max_sitemaps: int = 25) -> List[str]:
+    """
+    List the PDF URLs a host publishes in its sitemaps
+    
+    The sitemaps come from the 'Sitemap:' lines of robots.txt, or the
+    conventional /sitemap.xml if it lists none. Each is stream-parsed, so
+    even 50,000-entry files are read in constant memory; sitemap indexes
+    are followed up to max_sitemaps files in total.
+    
+    Args:
+        session: HTTP session to fetch with
+        host: Hostname such as 'providers.anthem.com'
+        max_sitemaps: Most sitemap files read for the host
+        
+    Returns:
+        PDF URLs in sitemap order (empty if the host has no usable sitemap);
+        callers decide which hosts to keep
+    """
+    queue = []
+    try:
+        response = session.get(f"https://{host}/robots.txt", timeout=10)
+        if response.ok:
+            queue = [line.split(':', 1)[1].strip()
+                     for line in response.text.splitlines()
+                     if line.lower().startswith('sitemap:')]
+    except requests.RequestException:
+        pass
+    queue = queue or [f"https://{host}/sitemap.xml"]
+    
+    sitemaps_read = set()
+    pdf_urls = []
+    while queue and len(sitemaps_read) < max_sitemaps:
+        sitemap_url = queue.pop(0)
+        if sitemap_url in sitemaps_read:
+            continue
+        sitemaps_read.add(sitemap_url)
+        
+        try:
+            with session.get(sitemap_url, timeout=15, stream=True) as response:
+                if not response.ok:
+                    continue
+                response.raw.decode_content = True
+                stream = gzip.GzipFile(fileobj=response.raw) if sitemap_url.endswith('.gz') else response.raw
+                
+                is_index = False
+                for event, elem in ElementTree.iterparse(stream, events=('start', 'end')):
+                    tag = elem.tag.rsplit('}', 1)[-1]
+                    if event == 'start':
+                        is_index = is_index or tag == 'sitemapindex'
+                        continue
+                    if tag == 'loc' and elem.text:
+                        loc = elem.text.strip()
+                        if is_index:
+                            queue.append(loc)
+                        elif urlparse(loc).path.lower().endswith('.pdf'):
+                            pdf_urls.append(loc)
+                    elem.clear()
+        except (requests.RequestException, ElementTree.ParseError, OSError):
+            continue
+    
+    return list(dict.fromkeys(pdf_urls))
+
+
 class PayerPortalCrawler:
     """
     Comprehensive crawler for healthcare payer portals
     Handles dynamic content, login requirements, and structured data extraction
     """
     
-    def __init__(self, headless: bool = True, timeout: int = 30):
+    def __init__(self, headless: bool = True, timeout: int = 30,
+                 session: Optional[requests.Session] = None, fast_path: bool = True,
+                 max_download_workers: int = 8):
         """
         Initialize the crawler with Chrome WebDriver
         
         Args:
             headless: Run browser in headless mode
             timeout: Default timeout for web elements
+            session: HTTP session to share with other crawlers; one is
+                created (and closed with the crawler) if not given
+            fast_path: Fetch pages over plain HTTP first and only start
+                Chrome for pages whose static HTML has none of the links
+                the crawl is after (e.g. lists rendered by JavaScript)
+            max_download_workers: PDFs downloaded concurrently per payer
         """
         self.timeout = timeout
+        self.fast_path = fast_path
+        self.max_download_workers = max_download_workers
         self.setup_logging()
         
+        # Pooled keep-alive HTTP session for everything fetched outside the browser
+        self._owns_session = session is None
+        self.session = session if session is not None else create_http_session()
+        
+        # Compiled keyword alternations, keyed by keyword tuple
+        self._keyword_patterns = {}
+        
+        # Per-host politeness: earliest time (monotonic) the next request may hit a host
+        self._host_next_fetch = {}
+        
         # Create downloads directory
         self.downloads_dir = Path("payer_pdfs")
         self.downloads_dir.mkdir(exist_ok=True)
         
-        self.setup_webdriver(headless)
+        # Extracted PDF content keyed by the SHA-256 of the file, so a PDF that is
+        # unchanged since the last run (or linked under another URL) is parsed once
+        self.extraction_cache_dir = self.downloads_dir / ".extracted"
+        self.extraction_cache_dir.mkdir(exist_ok=True)
+        
+        # Chrome is started on first use when the fast path is on, so a run
+        # over static portals never launches a browser at all
+        self._headless = headless
+        self.driver = None
+        if not fast_path:
+            self.setup_webdriver(headless)
         self.results = {}
         
         # Define target payers and their portal configurations
@@ -78,14 +433,31 @@ class PayerPortalCrawler:
         
     def setup_logging(self):
         """Setup logging configuration"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('payer_crawler.log'),
-                logging.StreamHandler()
-            ]
-        )
+        # basicConfig is a no-op once the root logger has handlers; don't open
+        # (and leak) another log file for every crawler instance
+        if not logging.getLogger().handlers:
+            log_format = '%(asctime)s - %(levelname)s - %(message)s'
+            
+            # Buffer log file writes; errors and interpreter exit flush the buffer.
+            # basicConfig only formats the handlers it is given, so the wrapped
+            # file handler needs its own formatter
+            log_file = logging.FileHandler('payer_crawler.log')
+            log_file.setFormatter(logging.Formatter(log_format))
+            file_handler = logging.handlers.MemoryHandler(
+                capacity=256,
+                flushLevel=logging.ERROR,
+                target=log_file
+            )
+            atexit.register(file_handler.close)
+            
+            logging.basicConfig(
+                level=logging.INFO,
+                format=log_format,
+                handlers=[
+                    file_handler,
+                    logging.StreamHandler()
+                ]
+            )
         self.logger = logging.getLogger(__name__)
         
     def setup_webdriver(self, headless: bool):
@@ -101,6 +473,9 @@ class PayerPortalCrawler:
         chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--window-size=1920,1080')
         chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--disable-background-networking')
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
         
         # Configure download settings (only if downloads_dir is available)
         prefs = {
@@ -120,104 +495,91 @@ class PayerPortalCrawler:
         try:
             self.driver = webdriver.Chrome(options=chrome_options)
             self.driver.set_page_load_timeout(self.timeout)
+            
+            # Skip stylesheets, fonts and media; only the HTML is crawled
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(BLOCKED_RESOURCE_PATTERNS)})
             self.logger.info("WebDriver initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize WebDriver: {e}")
             raise
             
-    def _load_payer_configurations(self) -> Dict:
-        """Load payer portal configurations"""
-        return {
-            "united_healthcare": {
-                "name": "United Healthcare",
-                "base_url": "https://www.uhcprovider.com/",
-                "provider_portal": "https://www.uhcprovider.com/en/resource-library.html",
-                "additional_pages": [
-                    "https://www.uhcprovider.com/en/policies-protocols.html",
-                    "https://www.uhcprovider.com/en/prior-authorization.html",
-                    "https://www.uhcprovider.com/en/claims-payments.html"
-                ],
-                "target_sections": {
-                    "prior_authorization": [
-                        "prior authorization", "preauthorization", "pre-auth",
-                        "authorization requirements", "auth criteria"
-                    ],
-                    "timely_filing": [
-                        "timely filing", "claim submission deadlines", 
-                        "filing requirements", "submission timelines"
-                    ],
-                    "appeals": [
-                        "appeals process", "claim appeals", "dispute resolution",
-                        "appeal procedures", "grievances"
-                    ]
-                },
-                "login_required": False,  # Start with public areas
-                "rate_limit": 2  # seconds between requests
-            },
+    def _get_driver(self) -> webdriver.Chrome:
+        """Return the WebDriver, starting Chrome if it isn't running yet"""
+        if self.driver is None:
+            self.setup_webdriver(self._headless)
+        return self.driver
+    
+    def _fetch_static_html(self, url: str, need_pdf_links: bool = False) -> Optional[Tuple[str, str]]:
+        """
+        Fetch a page over the HTTP session, without the browser
+        
+        The static page is only used if it already links what the caller is
+        after: PDFs when need_pdf_links is set, otherwise PDFs/documents or
+        provider-relevant pages. Anything else (typically a JavaScript app
+        shell with only navigation links) is left to the browser.
+        
+        Args:
+            url: Page URL
+            need_pdf_links: Require PDF links in the static HTML
             
-            "anthem": {
-                "name": "Anthem/Elevance Health",
-                "base_url": "https://providers.anthem.com/",
-                "provider_portal": "https://providers.anthem.com/docs/gpp/",
-                "direct_pdf_urls": [
-                    "https://files.providernews.anthem.com/1661/2022-Provider-Manual-pages-44-113.pdf",
-                    "https://providers.anthem.com/docs/gpp/OH_CAID_ProviderManual.pdf?v=202210032112",
-                    "https://providers.anthem.com/docs/gpp/NY_ABC_CAID_ProviderManual.pdf?v=202501161732",
-                    "https://providers.anthem.com/docs/gpp/OH_CAID_ClaimsEscalation.pdf",
-                    "https://providers.anthem.com/docs/gpp/NV_CAID_PriorAuthreq006648-22.pdf",
-                    "https://providers.anthem.com/docs/gpp/VA_CAID_ProviderManual.pdf?v=202105212022",
-                    "https://providers.anthem.com/docs/gpp/california-provider/CA_CAID_ProviderManual.pdf",
-                    "https://providers.anthem.com/docs/gpp/WI_CAID_Provider_Manual.pdf?v=202504111439"
-                ],
-                "additional_pages": [
-                    "https://www.anthem.com/provider/forms/",
-                    "https://www.anthem.com/provider/individual-commercial/prior-authorization/"
-                ],
-                "target_sections": {
-                    "prior_authorization": [
-                        "prior authorization", "preauthorization", "medical necessity",
-                        "authorization lists", "pre-auth requirements"
-                    ],
-                    "timely_filing": [
-                        "timely filing", "claim deadlines", "filing limits",
-                        "submission requirements", "billing deadlines"
-                    ],
-                    "appeals": [
-                        "appeals", "claim disputes", "grievance procedures",
-                        "appeal guidelines", "dispute resolution"
-                    ]
-                },
-                "login_required": False,
-                "rate_limit": 2
-            },
+        Returns:
+            (html, final_url) for a static HTML page with such links, or
+            None if the page has to be rendered in the browser
+        """
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self.logger.debug("Static fetch failed for %s, using browser: %s", url, e)
+            return None
+        
+        if 'html' not in response.headers.get('Content-Type', '').lower():
+            return None
+        
+        html = response.text
+        if not STATIC_ANCHOR_RE.search(html) or not self._has_wanted_links(html, need_pdf_links):
+            self.logger.debug("No useful static links on %s, rendering in browser", url)
+            return None
+        return html, response.url
+    
+    def _has_wanted_links(self, html: str, need_pdf_links: bool) -> bool:
+        """Whether a static page links PDFs (or, unless need_pdf_links, documents or relevant pages)"""
+        for href, text in extract_links(html):
+            if '.pdf' in href.lower():
+                return True
+            if not need_pdf_links and (DOCUMENT_HREF_RE.search(href) or
+                                       RELEVANT_LINK_RE.search(text) or
+                                       RELEVANT_LINK_RE.search(href)):
+                return True
+        return False
+    
+    def _load_page(self, url: str, need_pdf_links: bool = False) -> Tuple[str, str]:
+        """
+        Load a page, over plain HTTP when possible and in Chrome otherwise
+        
+        Args:
+            url: Page URL
+            need_pdf_links: Only accept the static page if it links PDFs
+                (see _fetch_static_html)
             
-            "aetna": {
-                "name": "Aetna",
-                "base_url": "https://www.aetna.com/",
-                "provider_portal": "https://www.aetna.com/health-care-professionals.html",
-                "additional_pages": [
-                    "https://www.aetna.com/health-care-professionals/provider-education-center.html",
-                    "https://www.aetna.com/health-care-professionals/clinical-policy-bulletins.html",
-                    "https://www.aetna.com/health-care-professionals/claims-payment.html"
-                ],
-                "target_sections": {
-                    "prior_authorization": [
-                        "prior authorization", "preauthorization", "pre-auth",
-                        "authorization requirements", "medical review"
-                    ],
-                    "timely_filing": [
-                        "timely filing", "claim submission", "filing deadlines",
-                        "billing requirements", "submission timelines"
-                    ],
-                    "appeals": [
-                        "appeals process", "claim appeals", "disputes",
-                        "appeal procedures", "grievance process"
-                    ]
-                },
-                "login_required": False,
-                "rate_limit": 2
-            }
-        }
+        Returns:
+            (html, final_url) of the loaded page
+        """
+        if self.fast_path:
+            page = self._fetch_static_html(url, need_pdf_links)
+            if page is not None:
+                return page
+        
+        driver = self._get_driver()
+        driver.get(url)
+        self.wait_for_page_load()
+        return driver.page_source, driver.current_url
+    
+    def _load_payer_configurations(self) -> Dict:
+        """Load payer portal configurations"""
+        # Shallow copy so per-instance additions/removals don't leak between crawlers
+        return dict(PAYER_CONFIGURATIONS)
     
     def crawl_payer(self, payer_key: str) -> Dict:
         """
@@ -237,11 +599,11 @@ class PayerPortalCrawler:
         
         try:
             # Navigate to provider portal
-            self.driver.get(config['provider_portal'])
-            self.wait_for_page_load()
+            self._respect_rate_limit(config['provider_portal'], config['rate_limit'])
+            html_content, page_url = self._load_page(config['provider_portal'])
             
             # Extract page content
-            page_data = self._extract_page_content(config)
+            page_data = self._extract_page_content(html_content, page_url, config)
             
             # Find relevant sections
             extracted_data = self._find_target_sections(page_data, config)
@@ -274,17 +636,15 @@ class PayerPortalCrawler:
             self.logger.error(f"Error crawling {config['name']}: {e}")
             return {'error': str(e), 'payer': config['name']}
     
-    def _extract_page_content(self, config: Dict) -> Dict:
-        """Extract content from current page"""
+    def _extract_page_content(self, html_content: str, page_url: str, config: Dict) -> Dict:
+        """Extract content from a loaded page"""
         try:
-            # Get page source
-            html_content = self.driver.page_source
             soup = BeautifulSoup(html_content, 'html.parser')
             
             # Extract structured data
             page_data = {
                 'title': soup.title.string if soup.title else '',
-                'url': self.driver.current_url,
+                'url': page_url,
                 'text_content': soup.get_text(),
                 'links': self._extract_links(soup, config['base_url']),
                 'sections': self._extract_sections(soup),
@@ -323,35 +683,19 @@ class PayerPortalCrawler:
     
     def _is_relevant_link(self, text: str, href: str) -> bool:
         """Determine if a link is relevant for our crawling"""
-        text_lower = text.lower()
-        href_lower = href.lower()
-        
-        relevant_keywords = [
-            'prior auth', 'authorization', 'timely filing', 'appeals',
-            'provider', 'manual', 'guideline', 'policy', 'procedure',
-            'claim', 'billing', 'reimbursement', 'coverage'
-        ]
-        
-        return any(keyword in text_lower or keyword in href_lower 
-                  for keyword in relevant_keywords)
+        return (RELEVANT_LINK_RE.search(text) is not None or
+                RELEVANT_LINK_RE.search(href) is not None)
     
     def _classify_link_type(self, text: str, href: str) -> str:
         """Classify the type of link"""
-        text_lower = text.lower()
-        href_lower = href.lower()
-        
-        if any(ext in href_lower for ext in ['.pdf', '.doc', '.docx']):
+        if DOCUMENT_HREF_RE.search(href):
             return 'document'
-        elif 'prior auth' in text_lower or 'authorization' in text_lower:
-            return 'prior_authorization'
-        elif 'timely filing' in text_lower or 'deadline' in text_lower:
-            return 'timely_filing'
-        elif 'appeal' in text_lower or 'dispute' in text_lower:
-            return 'appeals'
-        elif 'manual' in text_lower or 'guide' in text_lower:
-            return 'manual'
-        else:
-            return 'general'
+        
+        # First matching type wins, so the checks keep their priority order
+        for link_type, pattern in LINK_TYPE_PATTERNS:
+            if pattern.search(text):
+                return link_type
+        return 'general'
     
     def _extract_sections(self, soup: BeautifulSoup) -> List[Dict]:
         """Extract main content sections from the page"""
@@ -443,29 +787,41 @@ class PayerPortalCrawler:
                 })
         else:
             # Standard web crawling approach
-            pages_to_search = [config['provider_portal']]
-            if 'additional_pages' in config:
-                pages_to_search.extend(config['additional_pages'])
+            # Deduplicate (order-preserving) so a page listed twice is only fetched once
+            pages_to_search = list(dict.fromkeys(
+                [config['provider_portal']] + config.get('additional_pages', [])
+            ))
             
             try:
                 # Search for PDFs across multiple pages
                 for page_url in pages_to_search:
                     try:
-                        self.logger.info(f"Searching for PDFs on: {page_url}")
-                        self.driver.get(page_url)
-                        self.wait_for_page_load()
+                        self.logger.debug("Searching for PDFs on: %s", page_url)
+                        self._respect_rate_limit(page_url, config['rate_limit'])
+                        html_content, current_url = self._load_page(page_url, need_pdf_links=True)
                         
                         # Find PDF links on this page
-                        page_pdf_links = self._find_pdf_links()
+                        page_pdf_links = self._find_pdf_links(html_content, current_url)
                         all_pdf_links.extend(page_pdf_links)
                         
-                        # Rate limiting between pages
-                        time.sleep(config['rate_limit'])
-                        
                     except Exception as e:
                         self.logger.warning(f"Failed to search page {page_url}: {e}")
                         continue
                 
+                # PDFs listed in the payer's sitemaps (recorded by auto-discovery) join
+                # the candidates; the pages are still crawled, since a sitemap that
+                # lists some PDFs need not list them all. Page links win, as they
+                # carry link text for the relevance filter
+                linked_urls = {pdf_info['url'] for pdf_info in all_pdf_links}
+                for pdf_url in config.get('sitemap_pdf_urls', []):
+                    if pdf_url in linked_urls:
+                        continue
+                    all_pdf_links.append({
+                        'url': pdf_url,
+                        'text': '',
+                        'filename': os.path.basename(urlparse(pdf_url).path)
+                    })
+                
                 # Remove duplicates based on URL
                 unique_pdfs = {}
                 for pdf_info in all_pdf_links:
@@ -480,43 +836,93 @@ class PayerPortalCrawler:
         
         self.logger.info(f"Found {len(all_pdf_links)} total PDFs to download")
         
-        # Download PDFs
-        for pdf_info in all_pdf_links[:15]:  # Limit to top 15 most relevant
-            try:
-                downloaded_file = self._download_pdf(pdf_info, payer_key)
-                if downloaded_file:
-                    # Extract content from PDF
-                    pdf_content = self._extract_pdf_content(downloaded_file)
-                    
-                    pdf_info.update({
-                        'local_file': downloaded_file,
-                        'extracted_content': pdf_content,
-                        'download_timestamp': datetime.now().isoformat()
-                    })
-                    downloaded_pdfs.append(pdf_info)
-                    
-                    self.logger.info(f"Successfully downloaded and extracted: {pdf_info['filename']}")
-                    
-            except Exception as e:
-                self.logger.error(f"Failed to download PDF {pdf_info['url']}: {e}")
-                continue
+        # Download PDFs concurrently; map keeps the relevance order of the results
+        pdfs_to_fetch = all_pdf_links[:15]  # Limit to top 15 most relevant
+        self._assign_local_filenames(pdfs_to_fetch)
+        if pdfs_to_fetch:
+            workers = min(self.max_download_workers, len(pdfs_to_fetch))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                fetched = executor.map(
+                    lambda pdf_info: self._download_and_extract(pdf_info, payer_key),
+                    pdfs_to_fetch
+                )
+                downloaded_pdfs = [pdf_info for pdf_info in fetched if pdf_info is not None]
+            
+            # One progress line per batch; per-file lines are DEBUG
+            self.logger.info("Downloaded %d of %d PDFs for %s",
+                             len(downloaded_pdfs), len(pdfs_to_fetch), config['name'])
                 
         return downloaded_pdfs
     
-    def _find_pdf_links(self) -> List[Dict]:
-        """Find all PDF links on the current page"""
-        pdf_links = []
+    def _assign_local_filenames(self, pdf_links: List[Dict]):
+        """
+        Give every PDF in a batch its own file name before the download workers start
         
-        # Get page source and find PDF links
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+        Portals often link the same basename from different folders
+        (/OH/ProviderManual.pdf, /CA/ProviderManual.pdf); a repeated name gets
+        a short hash of its URL so no two workers write the same path.
         
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            text = link.get_text(strip=True)
+        Args:
+            pdf_links: PDF link info dicts; each gets a 'local_filename'
+        """
+        used = set()
+        for pdf_info in pdf_links:
+            local_filename = re.sub(r'[^\w\-_\.]', '_', pdf_info['filename'])
+            if local_filename.lower() in used:
+                stem, dot, suffix = local_filename.rpartition('.')
+                if not dot:
+                    stem, suffix = local_filename, ''
+                url_hash = hashlib.sha1(pdf_info['url'].encode()).hexdigest()[:10]
+                local_filename = f"{stem}_{url_hash}{dot}{suffix}"
+                # The same URL listed twice hashes the same; count up until free
+                attempt = 1
+                while local_filename.lower() in used:
+                    attempt += 1
+                    local_filename = f"{stem}_{url_hash}_{attempt}{dot}{suffix}"
+            used.add(local_filename.lower())
+            pdf_info['local_filename'] = local_filename
+    
+    def _download_and_extract(self, pdf_info: Dict, payer_key: str) -> Optional[Dict]:
+        """
+        Download one PDF and extract its content (runs on a download worker)
+        
+        Args:
+            pdf_info: PDF link info with 'url' and 'filename'
+            payer_key: Payer the PDF belongs to
+            
+        Returns:
+            pdf_info updated with the local file and extracted content,
+            or None if the download failed
+        """
+        try:
+            downloaded_file = self._download_pdf(pdf_info, payer_key)
+            if not downloaded_file:
+                return None
+            
+            # Extract content from PDF (reused if these exact bytes were seen before)
+            pdf_content = self._cached_pdf_content(downloaded_file, pdf_info['sha256'])
+            
+            pdf_info.update({
+                'local_file': downloaded_file,
+                'extracted_content': pdf_content,
+                'download_timestamp': datetime.now().isoformat()
+            })
             
-            if href.lower().endswith('.pdf') or '.pdf' in href.lower():
+            self.logger.debug("Successfully downloaded and extracted: %s", pdf_info['filename'])
+            return pdf_info
+            
+        except Exception as e:
+            self.logger.error(f"Failed to download PDF {pdf_info['url']}: {e}")
+            return None
+    
+    def _find_pdf_links(self, html_content: str, page_url: str) -> List[Dict]:
+        """Find all PDF links on a loaded page"""
+        pdf_links = []
+        
+        for href, text in extract_links(html_content):
+            if '.pdf' in href.lower():
                 # Convert relative URLs to absolute
-                full_url = urljoin(self.driver.current_url, href)
+                full_url = urljoin(page_url, href)
                 
                 pdf_links.append({
                     'url': full_url,
@@ -558,50 +964,76 @@ class PayerPortalCrawler:
             payer_dir = self.downloads_dir / payer_key
             payer_dir.mkdir(exist_ok=True)
             
-            # Clean filename
-            clean_filename = re.sub(r'[^\w\-_\.]', '_', pdf_info['filename'])
+            # Unique per batch (see _assign_local_filenames)
+            clean_filename = pdf_info['local_filename']
             local_file = payer_dir / clean_filename
             
-            # Enhanced headers to mimic browser request
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'application/pdf,application/octet-stream,*/*',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-            }
-            
-            # Download using requests with enhanced headers
-            session = requests.Session()
-            response = session.get(pdf_info['url'], headers=headers, timeout=30, stream=True, allow_redirects=True)
-            response.raise_for_status()
-            
-            # Check if response is actually a PDF
-            content_type = response.headers.get('content-type', '').lower()
-            
-            # Download content
+            # Download over the shared keep-alive session so PDFs from the same
+            # portal reuse one connection instead of a fresh TCP/TLS handshake each
+            # Stream straight to disk in 64 KB chunks; the with-block hands the
+            # connection back to the pool even when a write fails midway.
+            # The bytes go to a part file that is moved into place once complete,
+            # so the final path only ever holds exactly the bytes that were hashed
             total_size = 0
-            with open(local_file, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        total_size += len(chunk)
+            digest = hashlib.sha256()
+            part_file = local_file.with_name(local_file.name + '.part')
+            with self.session.get(pdf_info['url'], headers=PDF_REQUEST_HEADERS, timeout=30, stream=True, allow_redirects=True) as response:
+                response.raise_for_status()
+                with open(part_file, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        if chunk:
+                            f.write(chunk)
+                            digest.update(chunk)
+                            total_size += len(chunk)
             
             # Check file size
             if total_size < 1000:
                 self.logger.warning(f"Downloaded file seems too small: {total_size} bytes")
-                os.remove(local_file)
+                os.remove(part_file)
                 return None
             
-            self.logger.info(f"Successfully downloaded PDF: {clean_filename} ({total_size} bytes)")
+            os.replace(part_file, local_file)
+            pdf_info['sha256'] = digest.hexdigest()
+            self.logger.debug("Successfully downloaded PDF: %s (%d bytes)", clean_filename, total_size)
             return str(local_file)
             
         except Exception as e:
             self.logger.error(f"Failed to download PDF from {pdf_info['url']}: {e}")
             return None
     
+    def _cached_pdf_content(self, pdf_file: str, sha256: str) -> Dict:
+        """
+        Extract content from a PDF, reusing an earlier extraction of the same bytes
+        
+        Args:
+            pdf_file: Path of the downloaded PDF; must hold exactly the bytes
+                that were hashed (as _download_pdf leaves it)
+            sha256: Hex SHA-256 of the file contents
+            
+        Returns:
+            Extracted content dictionary, as from _extract_pdf_content
+        """
+        cache_file = self.extraction_cache_dir / f"{sha256}-v{EXTRACTION_CACHE_VERSION}.json"
+        try:
+            content = orjson.loads(cache_file.read_bytes())
+            self.logger.debug("Reusing extracted content for %s", pdf_file)
+            return content
+        except (OSError, ValueError):
+            pass
+        
+        content = self._extract_pdf_content(pdf_file)
+        if 'error' in content:
+            return content
+        
+        # Per-thread temp name: two workers may extract the same bytes at once
+        temp_file = cache_file.with_name(f"{cache_file.name}.{threading.get_ident()}.tmp")
+        try:
+            temp_file.write_bytes(orjson.dumps(content))
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            self.logger.warning(f"Failed to write extraction cache {cache_file}: {e}")
+        return content
+    
     def _extract_pdf_content(self, pdf_file: str) -> Dict:
         """Extract content from a PDF file"""
         content = {
@@ -624,19 +1056,25 @@ class PayerPortalCrawler:
                     'page_number': page_num + 1,
                     'text': page_text
                 })
-                content['text'] += page_text + '\n'
             
             doc.close()
             
-            # Extract structured information
-            content['extracted_rules'] = self._extract_rules_from_text(content['text'])
+            # Join once rather than growing the string page by page
+            content['text'], page_starts = self._join_pages(content['pages'])
+            
+            # Extract structured information over the whole document, so rules
+            # that run across a page break are kept intact
+            content['extracted_rules'] = self._extract_rules_from_text(content['text'], page_starts)
             content['geographic_zones'] = self._extract_geographic_zones(content['text'])
             
         except Exception as e:
             self.logger.error(f"PyMuPDF extraction failed, trying PyPDF2: {e}")
             
-            # Fallback to PyPDF2
+            # Fallback to PyPDF2, discarding any pages PyMuPDF got through
+            content['pages'] = []
             try:
+                import PyPDF2
+                
                 with open(pdf_file, 'rb') as file:
                     pdf_reader = PyPDF2.PdfReader(file)
                     
@@ -646,10 +1084,10 @@ class PayerPortalCrawler:
                             'page_number': page_num + 1,
                             'text': page_text
                         })
-                        content['text'] += page_text + '\n'
                 
+                content['text'], page_starts = self._join_pages(content['pages'])
                 content['extraction_method'] = 'pypdf2'
-                content['extracted_rules'] = self._extract_rules_from_text(content['text'])
+                content['extracted_rules'] = self._extract_rules_from_text(content['text'], page_starts)
                 content['geographic_zones'] = self._extract_geographic_zones(content['text'])
                 
             except Exception as e2:
@@ -658,41 +1096,53 @@ class PayerPortalCrawler:
         
         return content
     
-    def _extract_rules_from_text(self, text: str) -> List[Dict]:
-        """Extract payer rules from PDF text"""
-        rules = []
-        text_lower = text.lower()
+    def _join_pages(self, pages: List[Dict]) -> Tuple[str, List[int]]:
+        """
+        Join extracted pages into the document text
         
-        # Define rule patterns
-        rule_patterns = {
-            'prior_authorization': [
-                r'prior authorization.*?(?=\n\n|\n[A-Z]|$)',
-                r'preauthorization.*?(?=\n\n|\n[A-Z]|$)',
-                r'authorization required.*?(?=\n\n|\n[A-Z]|$)'
-            ],
-            'timely_filing': [
-                r'timely filing.*?(?=\n\n|\n[A-Z]|$)',
-                r'filing deadline.*?(?=\n\n|\n[A-Z]|$)',
-                r'submit.*?within.*?days.*?(?=\n\n|\n[A-Z]|$)'
-            ],
-            'appeals': [
-                r'appeal.*?process.*?(?=\n\n|\n[A-Z]|$)',
-                r'grievance.*?procedure.*?(?=\n\n|\n[A-Z]|$)',
-                r'dispute.*?resolution.*?(?=\n\n|\n[A-Z]|$)'
-            ]
-        }
+        Args:
+            pages: Page entries with a 'text' key, in page order
+            
+        Returns:
+            The full text (one newline after each page) and the offset
+            at which each page starts in it
+        """
+        page_starts = []
+        offset = 0
+        for page in pages:
+            page_starts.append(offset)
+            offset += len(page['text']) + 1
+        
+        return ''.join(page['text'] + '\n' for page in pages), page_starts
+    
+    def _extract_rules_from_text(self, text: str, page_starts: Optional[List[int]] = None) -> List[Dict]:
+        """
+        Extract payer rules from PDF text
+        
+        Args:
+            text: Full document text
+            page_starts: Offset of each page in text; when given, each rule
+                records the page it starts on
+        """
+        rules = []
+        # Manuals repeat boilerplate paragraphs (headers, footers, per-section
+        # reminders); keep the first occurrence of each rule text per type
+        seen = set()
         
-        for rule_type, patterns in rule_patterns.items():
+        for rule_type, patterns in RULE_PATTERNS.items():
             for pattern in patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE | re.DOTALL)
-                for match in matches:
+                for match in pattern.finditer(text):
                     rule_text = match.group().strip()
-                    if len(rule_text) > 50:  # Filter out very short matches
-                        rules.append({
+                    if len(rule_text) > 50 and (rule_type, rule_text) not in seen:  # Filter out very short matches
+                        seen.add((rule_type, rule_text))
+                        rule = {
                             'type': rule_type,
                             'content': rule_text,
                             'confidence': len(rule_text) / 1000  # Simple confidence based on length
-                        })
+                        }
+                        if page_starts:
+                            rule['page_number'] = bisect_right(page_starts, match.start())
+                        rules.append(rule)
         
         return rules
     
@@ -701,24 +1151,9 @@ class PayerPortalCrawler:
         zones = []
         text_lower = text.lower()
         
-        # Common geographic identifiers
-        state_patterns = [
-            r'(alabama|alaska|arizona|arkansas|california|colorado|connecticut|delaware|florida|georgia|hawaii|idaho|illinois|indiana|iowa|kansas|kentucky|louisiana|maine|maryland|massachusetts|michigan|minnesota|mississippi|missouri|montana|nebraska|nevada|new hampshire|new jersey|new mexico|new york|north carolina|north dakota|ohio|oklahoma|oregon|pennsylvania|rhode island|south carolina|south dakota|tennessee|texas|utah|vermont|virginia|washington|west virginia|wisconsin|wyoming)',
-            r'(al|ak|az|ar|ca|co|ct|de|fl|ga|hi|id|il|in|ia|ks|ky|la|me|md|ma|mi|mn|ms|mo|mt|ne|nv|nh|nj|nm|ny|nc|nd|oh|ok|or|pa|ri|sc|sd|tn|tx|ut|vt|va|wa|wv|wi|wy)'
-        ]
-        
-        region_patterns = [
-            r'region\s+\d+',
-            r'zone\s+[a-z0-9]+',
-            r'area\s+[a-z0-9]+',
-            r'network\s+[a-z0-9]+',
-            r'service\s+area'
-        ]
-        
         # Extract state mentions
-        for pattern in state_patterns:
-            matches = re.finditer(pattern, text_lower)
-            for match in matches:
+        for pattern in STATE_PATTERNS:
+            for match in pattern.finditer(text_lower):
                 zones.append({
                     'type': 'state',
                     'value': match.group().upper(),
@@ -726,9 +1161,8 @@ class PayerPortalCrawler:
                 })
         
         # Extract region/zone mentions
-        for pattern in region_patterns:
-            matches = re.finditer(pattern, text_lower)
-            for match in matches:
+        for pattern in REGION_PATTERNS:
+            for match in pattern.finditer(text_lower):
                 zones.append({
                     'type': 'region',
                     'value': match.group(),
@@ -739,37 +1173,56 @@ class PayerPortalCrawler:
     
     def _find_target_sections(self, page_data: Dict, config: Dict) -> Dict:
         """Find content sections matching our target areas"""
-        target_sections = config['target_sections']
-        found_content = {}
-        
-        for section_type, keywords in target_sections.items():
-            found_content[section_type] = {
-                'sections': [],
-                'links': [],
-                'documents': []
-            }
-            
-            # Search in page sections
-            for section in page_data.get('sections', []):
-                if self._matches_keywords(section['header'] + ' ' + section['content'], keywords):
+        # One compiled alternation per section type, so each text is lowercased
+        # and scanned once per section type instead of once per keyword
+        patterns = {
+            section_type: self._keyword_pattern(keywords)
+            for section_type, keywords in config['target_sections'].items()
+        }
+        found_content = {
+            section_type: {'sections': [], 'links': [], 'documents': []}
+            for section_type in patterns
+        }
+        
+        # Search in page sections
+        for section in page_data.get('sections', []):
+            text_lower = (section['header'] + ' ' + section['content']).lower()
+            for section_type, pattern in patterns.items():
+                if pattern.search(text_lower):
                     found_content[section_type]['sections'].append(section)
-            
-            # Search in links
-            for link in page_data.get('links', []):
-                if self._matches_keywords(link['text'], keywords):
+        
+        # Search in links
+        for link in page_data.get('links', []):
+            text_lower = link['text'].lower()
+            for section_type, pattern in patterns.items():
+                if pattern.search(text_lower):
                     found_content[section_type]['links'].append(link)
-            
-            # Search in documents
-            for doc in page_data.get('download_links', []):
-                if self._matches_keywords(doc['text'], keywords):
+        
+        # Search in documents
+        for doc in page_data.get('download_links', []):
+            text_lower = doc['text'].lower()
+            for section_type, pattern in patterns.items():
+                if pattern.search(text_lower):
                     found_content[section_type]['documents'].append(doc)
         
         return found_content
     
-    def _matches_keywords(self, text: str, keywords: List[str]) -> bool:
-        """Check if text contains any of the target keywords"""
-        text_lower = text.lower()
-        return any(keyword.lower() in text_lower for keyword in keywords)
+    def _keyword_pattern(self, keywords: Tuple[str, ...]) -> re.Pattern:
+        """
+        Compile (once) a single alternation matching any of the keywords
+        
+        An empty keyword group gets a pattern that never matches; joining no
+        alternatives would compile '' and match every text.
+        """
+        key = tuple(keywords)
+        pattern = self._keyword_patterns.get(key)
+        if pattern is None:
+            if key:
+                pattern = re.compile('|'.join(re.escape(keyword.lower()) for keyword in key))
+            else:
+                pattern = re.compile(r'(?!)')
+            self._keyword_patterns[key] = pattern
+        return pattern
     
     def _crawl_detailed_sections(self, extracted_data: Dict, config: Dict) -> Dict:
         """Crawl deeper into relevant links for detailed information"""
@@ -793,12 +1246,10 @@ class PayerPortalCrawler:
                     break
                     
                 try:
+                    self._respect_rate_limit(link['url'], config['rate_limit'])
                     self._crawl_individual_page(link['url'], section_type, detailed_data)
                     pages_crawled += 1
                     
-                    # Rate limiting
-                    time.sleep(config['rate_limit'])
-                    
                 except Exception as e:
                     self.logger.warning(f"Failed to crawl {link['url']}: {e}")
                     continue
@@ -808,11 +1259,9 @@ class PayerPortalCrawler:
     def _crawl_individual_page(self, url: str, section_type: str, detailed_data: Dict):
         """Crawl an individual page for specific content"""
         try:
-            self.driver.get(url)
-            self.wait_for_page_load()
+            html_content, _ = self._load_page(url)
             
             # Extract content from this page
-            html_content = self.driver.page_source
             soup = BeautifulSoup(html_content, 'html.parser')
             
             # Extract relevant information
@@ -830,7 +1279,7 @@ class PayerPortalCrawler:
             if section_type in detailed_data:
                 detailed_data[section_type]['rules'].extend(page_info['extracted_rules'])
             
-            self.logger.info(f"Successfully crawled page: {url}")
+            self.logger.debug("Successfully crawled page: %s", url)
             
         except Exception as e:
             self.logger.error(f"Error crawling individual page {url}: {e}")
@@ -844,12 +1293,11 @@ class PayerPortalCrawler:
         
         # Extract from lists
         for ul in soup.find_all('ul'):
-            list_items = [li.get_text(strip=True) for li in ul.find_all('li')]
-            if any(self._is_rule_content(item, section_type) for item in list_items):
-                rules.extend([
-                    {'type': 'list_item', 'content': item, 'source': 'ul'}
-                    for item in list_items if self._is_rule_content(item, section_type)
-                ])
+            # Classify each item once and keep the ones that look like rules
+            for li in ul.find_all('li'):
+                item = li.get_text(strip=True)
+                if self._is_rule_content(item, section_type):
+                    rules.append({'type': 'list_item', 'content': item, 'source': 'ul'})
         
         # Extract from tables
         for table in soup.find_all('table'):
@@ -875,32 +1323,19 @@ class PayerPortalCrawler:
     
     def _is_rule_content(self, text: str, section_type: str) -> bool:
         """Determine if text contains rule-like content"""
-        text_lower = text.lower()
+        # Cheap length check first so short fragments are never lowercased
+        if len(text) <= 20:
+            return False
         
-        rule_indicators = {
-            'prior_authorization': [
-                'must obtain', 'requires authorization', 'prior approval',
-                'pre-authorization required', 'contact for auth'
-            ],
-            'timely_filing': [
-                'days from', 'within', 'deadline', 'filing limit',
-                'submit by', 'time limit'
-            ],
-            'appeals': [
-                'appeal within', 'dispute process', 'grievance procedure',
-                'appeal deadline', 'contact to appeal'
-            ]
-        }
-        
-        indicators = rule_indicators.get(section_type, [])
-        return any(indicator in text_lower for indicator in indicators) and len(text) > 20
+        text_lower = text.lower()
+        return any(indicator in text_lower for indicator in RULE_INDICATORS.get(section_type, ()))
     
     def _extract_table_data(self, table) -> List[List[str]]:
         """Extract data from HTML table"""
         rows = []
         for tr in table.find_all('tr'):
             row = [td.get_text(strip=True) for td in tr.find_all(['td', 'th'])]
-            if any(cell for cell in row):  # Skip empty rows
+            if any(row):  # Skip empty rows
                 rows.append(row)
         return rows
     
@@ -917,6 +1352,23 @@ class PayerPortalCrawler:
         keywords = relevant_keywords.get(section_type, [])
         return any(keyword in table_text for keyword in keywords)
     
+    def _respect_rate_limit(self, url: str, min_interval: float):
+        """
+        Wait until the URL's host may be requested again
+        
+        Politeness is tracked per host rather than per payer, so pages on
+        different hosts are not delayed and payers sharing a host share a budget.
+        
+        Args:
+            url: URL about to be requested
+            min_interval: Minimum seconds between requests to the same host
+        """
+        host = urlparse(url).netloc.lower()
+        delay = self._host_next_fetch.get(host, 0) - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self._host_next_fetch[host] = time.monotonic() + min_interval
+    
     def wait_for_page_load(self, timeout: int = None):
         """Wait for page to fully load"""
         timeout = timeout or self.timeout
@@ -928,26 +1380,46 @@ class PayerPortalCrawler:
         except TimeoutException:
             self.logger.warning("Page load timeout - continuing anyway")
     
-    def crawl_all_payers(self) -> Dict:
-        """Crawl all configured payers"""
+    def crawl_all_payers(self, stream_file: str = "crawl_results.ndjson") -> Dict:
+        """
+        Crawl all configured payers
+        
+        Args:
+            stream_file: NDJSON file that receives one {"payer_key", "result"}
+                line as each payer finishes, so a crash loses at most the
+                payer in progress
+                
+        Returns:
+            Results keyed by payer
+        """
         self.logger.info("Starting comprehensive payer portal crawl")
         
         all_results = {}
         
-        for payer_key in self.payer_configs.keys():
-            try:
-                result = self.crawl_payer(payer_key)
-                all_results[payer_key] = result
-                
-                # Save intermediate results
-                self.save_results(all_results, f"crawl_results_partial_{payer_key}.json")
-                
-                # Pause between payers to be respectful
-                time.sleep(5)
-                
-            except Exception as e:
-                self.logger.error(f"Failed to crawl {payer_key}: {e}")
-                all_results[payer_key] = {'error': str(e)}
+        with open(stream_file, 'wb') as stream:
+            for payer_key in self.payer_configs.keys():
+                try:
+                    # The one browser is reused for every payer; start each payer
+                    # with a clean cookie jar so sessions don't leak between portals.
+                    # (delete_all_cookies only covers the current page's domain.)
+                    if self.driver is not None:
+                        self.driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+                    
+                    result = self.crawl_payer(payer_key)
+                    all_results[payer_key] = result
+                    
+                    # Append just this payer instead of rewriting every result so far
+                    self._append_result(stream, payer_key, result)
+                    
+                    # No pause between payers: politeness relies entirely on the
+                    # per-host budget in _respect_rate_limit, which also spaces out
+                    # consecutive payers on the same host (crawl_by_priority
+                    # deliberately orders payers so hosts come back to back)
+                    
+                except Exception as e:
+                    self.logger.error(f"Failed to crawl {payer_key}: {e}")
+                    all_results[payer_key] = {'error': str(e)}
+                    self._append_result(stream, payer_key, all_results[payer_key])
         
         # Save final results
         self.save_results(all_results, "crawl_results_final.json")
@@ -955,44 +1427,73 @@ class PayerPortalCrawler:
         self.logger.info(f"Completed crawling {len(all_results)} payers")
         return all_results
     
+    def _append_result(self, stream, payer_key: str, result: Dict):
+        """Write one payer's result as an NDJSON line and flush it to disk"""
+        stream.write(orjson.dumps(
+            {'payer_key': payer_key, 'result': result},
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+            default=str
+        ))
+        stream.flush()
+    
     def save_results(self, results: Dict, filename: str):
         """Save crawling results to JSON file"""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False, default=str)
+            # orjson emits UTF-8 bytes directly, so no encode pass on write
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(
+                    results,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    default=str
+                ))
             self.logger.info(f"Results saved to {filename}")
         except Exception as e:
             self.logger.error(f"Failed to save results: {e}")
     
     def generate_summary_report(self, results: Dict) -> Dict:
-        """Generate summary report of crawling results"""
-        summary = {
-            'crawl_timestamp': datetime.now().isoformat(),
-            'total_payers': len(results),
-            'successful_crawls': len([r for r in results.values() if 'error' not in r]),
-            'failed_crawls': len([r for r in results.values() if 'error' in r]),
-            'payer_summaries': {}
-        }
+        """Generate summary report of crawling results in one pass over them"""
+        payer_summaries = {}
+        successful = 0
+        total_rules = 0
+        total_pdfs = 0
         
         for payer_key, result in results.items():
-            if 'error' not in result:
-                payer_summary = {
-                    'payer_name': result.get('payer', 'Unknown'),
-                    'pages_crawled': len(result.get('extracted_content', {}).get('pages_visited', [])),
-                    'prior_auth_rules': len(result.get('extracted_content', {}).get('prior_authorization', {}).get('rules', [])),
-                    'timely_filing_rules': len(result.get('extracted_content', {}).get('timely_filing', {}).get('rules', [])),
-                    'appeals_rules': len(result.get('extracted_content', {}).get('appeals', {}).get('rules', []))
-                }
-            else:
-                payer_summary = {'error': result['error']}
-                
-            summary['payer_summaries'][payer_key] = payer_summary
+            if 'error' in result:
+                payer_summaries[payer_key] = {'error': result['error']}
+                continue
+            
+            successful += 1
+            content = result.get('extracted_content', {})
+            rule_counts = {
+                f'{short_name}_rules': len(content.get(section_type, {}).get('rules', []))
+                for section_type, short_name in SUMMARY_RULE_SECTIONS
+            }
+            pdf_count = len(result.get('pdf_documents', []))
+            
+            payer_summaries[payer_key] = {
+                'payer_name': result.get('payer', 'Unknown'),
+                'pages_crawled': len(content.get('pages_visited', [])),
+                **rule_counts,
+                'pdfs_downloaded': pdf_count
+            }
+            total_rules += sum(rule_counts.values())
+            total_pdfs += pdf_count
         
-        return summary
+        return {
+            'crawl_timestamp': datetime.now().isoformat(),
+            'total_payers': len(results),
+            'successful_crawls': successful,
+            'failed_crawls': len(results) - successful,
+            'total_rules': total_rules,
+            'total_pdfs': total_pdfs,
+            'payer_summaries': payer_summaries
+        }
     
     def close(self):
         """Clean up resources"""
-        if hasattr(self, 'driver'):
+        if self._owns_session:
+            self.session.close()
+        if self.driver is not None:
             self.driver.quit()
             self.logger.info("WebDriver closed")
 
@@ -1016,23 +1517,28 @@ def main():
         # Save summary
         crawler.save_results(summary, "crawl_summary_report.json")
         
-        # Print summary
-        print("\n=== CRAWLING SUMMARY ===")
-        print(f"Total Payers: {summary['total_payers']}")
-        print(f"Successful: {summary['successful_crawls']}")
-        print(f"Failed: {summary['failed_crawls']}")
+        # Print summary (built up front and written in one go)
+        lines = [
+            "\n=== CRAWLING SUMMARY ===",
+            f"Total Payers: {summary['total_payers']}",
+            f"Successful: {summary['successful_crawls']}",
+            f"Failed: {summary['failed_crawls']}",
+        ]
         
         for payer_key, payer_summary in summary['payer_summaries'].items():
             if 'error' not in payer_summary:
-                print(f"\n{payer_summary['payer_name']}:")
-                print(f"  Pages crawled: {payer_summary['pages_crawled']}")
-                print(f"  Prior auth rules: {payer_summary['prior_auth_rules']}")
-                print(f"  Timely filing rules: {payer_summary['timely_filing_rules']}")
-                print(f"  Appeals rules: {payer_summary['appeals_rules']}")
+                lines += [
+                    f"\n{payer_summary['payer_name']}:",
+                    f"  Pages crawled: {payer_summary['pages_crawled']}",
+                    f"  Prior auth rules: {payer_summary['prior_auth_rules']}",
+                    f"  Timely filing rules: {payer_summary['timely_filing_rules']}",
+                    f"  Appeals rules: {payer_summary['appeals_rules']}",
+                ]
             else:
-                print(f"\n{payer_key}: ERROR - {payer_summary['error']}")
+                lines.append(f"\n{payer_key}: ERROR - {payer_summary['error']}")
         
-        print("\n=== CRAWLING COMPLETED ===")
+        lines.append("\n=== CRAWLING COMPLETED ===")
+        sys.stdout.write("\n".join(lines) + "\n")
         
     except Exception as e:
         print(f"Critical error: {e}")
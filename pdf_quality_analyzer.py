@@ -15,19 +15,19 @@ Date: October 2025
 """
 
 import os
-import time
 import hashlib
 import logging
+import threading
 import requests
 import fitz  # PyMuPDF
 from pathlib import Path
 from urllib.parse import urlparse
 from datetime import datetime
-import pandas as pd
 import re
 from collections import Counter
-from typing import Dict, List, Set, Tuple
-import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+import orjson
 
 class PDFQualityAnalyzer:
     """Analyzes PDF quality and filters out irrelevant content"""
@@ -104,11 +104,13 @@ class PDFQualityAnalyzer:
             if not filename.endswith('.pdf'):
                 filename += '.pdf'
             
-            # Sanitize filename
+            # Sanitize filename; the URL hash keeps same-named PDFs from different
+            # folders (/OH/ProviderManual.pdf, /CA/ProviderManual.pdf) apart
             filename = re.sub(r'[^\w\-_\.]', '_', filename)
-            file_path = self.download_dir / filename
+            url_hash = hashlib.sha1(url.encode()).hexdigest()[:10]
+            file_path = self.download_dir / f"{filename[:-len('.pdf')]}_{url_hash}.pdf"
             
-            # Skip if already downloaded
+            # Skip if already downloaded (files only appear here once complete)
             if file_path.exists():
                 return True, str(file_path), ""
             
@@ -117,34 +119,45 @@ class PDFQualityAnalyzer:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
             
-            response = requests.get(url, headers=headers, timeout=timeout, stream=True)
-            response.raise_for_status()
-            
-            # Check content type
-            content_type = response.headers.get('content-type', '').lower()
-            if 'pdf' not in content_type and not url.lower().endswith('.pdf'):
-                return False, "", f"Not a PDF file (content-type: {content_type})"
-            
-            # Check file size
-            content_length = response.headers.get('content-length')
-            if content_length:
-                size = int(content_length)
-                if size < self.min_file_size:
-                    return False, "", f"File too small ({size} bytes)"
-                if size > self.max_file_size:
-                    return False, "", f"File too large ({size} bytes)"
-            
-            # Save file
-            with open(file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            with requests.get(url, headers=headers, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+                
+                # Check content type
+                content_type = response.headers.get('content-type', '').lower()
+                if 'pdf' not in content_type and not url.lower().endswith('.pdf'):
+                    return False, "", f"Not a PDF file (content-type: {content_type})"
+                
+                # Check file size
+                content_length = response.headers.get('content-length')
+                if content_length:
+                    size = int(content_length)
+                    if size < self.min_file_size:
+                        return False, "", f"File too small ({size} bytes)"
+                    if size > self.max_file_size:
+                        return False, "", f"File too large ({size} bytes)"
+                
+                # Save file, counting bytes as they arrive so servers that send no
+                # content-length still can't push past the size limit
+                actual_size = 0
+                part_path = file_path.with_name(f"{file_path.name}.{threading.get_ident()}.part")
+                with open(part_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        actual_size += len(chunk)
+                        if actual_size > self.max_file_size:
+                            break
+                        f.write(chunk)
             
             # Final size check
-            actual_size = file_path.stat().st_size
+            if actual_size > self.max_file_size:
+                part_path.unlink()
+                return False, "", f"File too large (over {self.max_file_size} bytes)"
             if actual_size < self.min_file_size:
-                file_path.unlink()
+                part_path.unlink()
                 return False, "", f"Downloaded file too small ({actual_size} bytes)"
             
+            # Move into place only when complete, so a concurrent worker's exists()
+            # check never sees a partial file
+            os.replace(part_path, file_path)
             return True, str(file_path), ""
             
         except Exception as e:
@@ -263,8 +276,22 @@ class PDFQualityAnalyzer:
         self.duplicate_groups = duplicate_groups
         return duplicate_groups
     
-    def analyze_pdf_batch(self, pdf_urls: List[str], max_downloads: int = 20) -> Dict:
-        """Analyze a batch of PDF URLs"""
+    def _download_and_inspect(self, url: str) -> Tuple[bool, str, str, Dict]:
+        """Download one PDF and read its metadata (runs on a worker thread)"""
+        success, file_path, error = self.download_pdf(url)
+        metadata = self.extract_pdf_metadata(file_path) if success else {}
+        return success, file_path, error, metadata
+    
+    def analyze_pdf_batch(self, pdf_urls: List[str], max_downloads: int = 20,
+                          max_workers: int = 8) -> Dict:
+        """
+        Analyze a batch of PDF URLs
+        
+        Args:
+            pdf_urls: PDF URLs in priority order
+            max_downloads: Stop after this many successful downloads
+            max_workers: Downloads (and metadata reads) in flight at once
+        """
         self.logger.info(f"Analyzing {len(pdf_urls)} PDF URLs (max downloads: {max_downloads})")
         
         results = {
@@ -279,72 +306,23 @@ class PDFQualityAnalyzer:
         }
         
         downloaded_count = 0
+        next_index = 0
         
-        for i, url in enumerate(pdf_urls):
-            if downloaded_count >= max_downloads:
-                self.logger.info(f"Reached download limit ({max_downloads})")
-                break
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Fetch in waves no larger than the downloads still allowed, so the
+            # limit holds exactly; failed URLs free their slot for the next wave
+            while downloaded_count < max_downloads and next_index < len(pdf_urls):
+                wave = pdf_urls[next_index:next_index + max_downloads - downloaded_count]
+                wave_start = next_index
+                next_index += len(wave)
                 
-            self.logger.info(f"Analyzing PDF {i+1}/{len(pdf_urls)}: {url}")
-            
-            # Download PDF
-            success, file_path, error = self.download_pdf(url)
-            
-            if not success:
-                self.logger.warning(f"Download failed: {error}")
-                results['analysis_results'][url] = {
-                    'download_success': False,
-                    'error': error
-                }
-                results['download_failed'] += 1
-                continue
-            
-            downloaded_count += 1
-            results['download_success'] += 1
-            
-            # Extract metadata
-            metadata = self.extract_pdf_metadata(file_path)
-            
-            if 'error' in metadata:
-                self.logger.warning(f"Metadata extraction failed: {metadata['error']}")
-                results['analysis_results'][url] = {
-                    'download_success': True,
-                    'file_path': file_path,
-                    'metadata_error': metadata['error']
-                }
-                continue
-            
-            # Categorize content
-            categorization = self.categorize_content(metadata)
-            
-            # Calculate content hash
-            content_hash = self.calculate_content_hash(metadata.get('text_sample', ''))
-            
-            # Store complete analysis
-            analysis = {
-                'download_success': True,
-                'file_path': file_path,
-                'metadata': metadata,
-                'categorization': categorization,
-                'content_hash': content_hash,
-                'url': url
-            }
-            
-            self.analysis_results[url] = analysis
-            results['analysis_results'][url] = analysis
-            results['analyzed_count'] += 1
-            
-            # Track relevance
-            if categorization['is_relevant']:
-                results['relevant_pdfs'] += 1
-            else:
-                results['irrelevant_pdfs'] += 1
-            
-            # Brief progress update
-            category = categorization['primary_category']
-            relevance = "✓" if categorization['is_relevant'] else "✗"
-            pages = metadata.get('page_count', 0)
-            self.logger.info(f"  {relevance} {category} | {pages} pages | {metadata.get('file_size', 0)/1024:.1f}KB")
+                for offset, (url, fetched) in enumerate(zip(wave, executor.map(self._download_and_inspect, wave))):
+                    self.logger.info(f"Analyzing PDF {wave_start + offset + 1}/{len(pdf_urls)}: {url}")
+                    if self._record_analysis(url, *fetched, results):
+                        downloaded_count += 1
+        
+        if downloaded_count >= max_downloads:
+            self.logger.info(f"Reached download limit ({max_downloads})")
         
         # Detect duplicates
         duplicate_groups = self.detect_duplicates()
@@ -353,6 +331,68 @@ class PDFQualityAnalyzer:
         
         return results
     
+    def _record_analysis(self, url: str, success: bool, file_path: str, error: str,
+                         metadata: Dict, results: Dict) -> bool:
+        """
+        Fold one fetched PDF into the batch results
+        
+        Returns:
+            True if the PDF was downloaded (counts toward max_downloads)
+        """
+        if not success:
+            self.logger.warning(f"Download failed: {error}")
+            results['analysis_results'][url] = {
+                'download_success': False,
+                'error': error
+            }
+            results['download_failed'] += 1
+            return False
+        
+        results['download_success'] += 1
+        
+        if 'error' in metadata:
+            self.logger.warning(f"Metadata extraction failed: {metadata['error']}")
+            results['analysis_results'][url] = {
+                'download_success': True,
+                'file_path': file_path,
+                'metadata_error': metadata['error']
+            }
+            return True
+        
+        # Categorize content
+        categorization = self.categorize_content(metadata)
+        
+        # Calculate content hash
+        content_hash = self.calculate_content_hash(metadata.get('text_sample', ''))
+        
+        # Store complete analysis
+        analysis = {
+            'download_success': True,
+            'file_path': file_path,
+            'metadata': metadata,
+            'categorization': categorization,
+            'content_hash': content_hash,
+            'url': url
+        }
+        
+        self.analysis_results[url] = analysis
+        results['analysis_results'][url] = analysis
+        results['analyzed_count'] += 1
+        
+        # Track relevance
+        if categorization['is_relevant']:
+            results['relevant_pdfs'] += 1
+        else:
+            results['irrelevant_pdfs'] += 1
+        
+        # Brief progress update
+        category = categorization['primary_category']
+        relevance = "✓" if categorization['is_relevant'] else "✗"
+        pages = metadata.get('page_count', 0)
+        self.logger.info(f"  {relevance} {category} | {pages} pages | {metadata.get('file_size', 0)/1024:.1f}KB")
+        
+        return True
+    
     def generate_quality_report(self, results: Dict) -> str:
         """Generate a comprehensive quality report"""
         report = []
@@ -375,13 +415,18 @@ class PDFQualityAnalyzer:
         report.append(f"Irrelevant PDFs: {irrelevant} ({irrelevant/analyzed*100:.1f}%)" if analyzed > 0 else "Irrelevant PDFs: 0")
         report.append(f"Duplicate groups: {duplicates}")
         
+        # Analyses that got as far as categorization, with it looked up once
+        categorized = [
+            (url, analysis, analysis['categorization'])
+            for url, analysis in results['analysis_results'].items()
+            if 'categorization' in analysis
+        ]
+        
         # Category breakdown
         if analyzed > 0:
-            category_counts = Counter()
-            for analysis in results['analysis_results'].values():
-                if 'categorization' in analysis:
-                    category = analysis['categorization']['primary_category']
-                    category_counts[category] += 1
+            category_counts = Counter(
+                categorization['primary_category'] for _, _, categorization in categorized
+            )
             
             report.append(f"\n📂 CONTENT CATEGORIES")
             for category, count in category_counts.most_common():
@@ -397,12 +442,10 @@ class PDFQualityAnalyzer:
                 'no_exclusions': 0
             }
             
-            for analysis in results['analysis_results'].values():
-                if 'categorization' in analysis:
-                    indicators = analysis['categorization']['quality_indicators']
-                    for metric, value in indicators.items():
-                        if value:
-                            quality_metrics[metric] += 1
+            for _, _, categorization in categorized:
+                for metric, value in categorization['quality_indicators'].items():
+                    if value:
+                        quality_metrics[metric] += 1
             
             report.append(f"\n✅ QUALITY METRICS")
             for metric, count in quality_metrics.items():
@@ -410,21 +453,19 @@ class PDFQualityAnalyzer:
                 report.append(f"{metric}: {count}/{analyzed} ({percentage:.1f}%)")
         
         # Top relevant PDFs
-        relevant_pdfs = [
-            (url, analysis) for url, analysis in results['analysis_results'].items()
-            if 'categorization' in analysis and analysis['categorization']['is_relevant']
-        ]
+        relevant_pdfs = [entry for entry in categorized if entry[2]['is_relevant']]
         
         if relevant_pdfs:
             # Sort by relevance score
-            relevant_pdfs.sort(key=lambda x: x[1]['categorization']['relevance_score'], reverse=True)
+            relevant_pdfs.sort(key=lambda entry: entry[2]['relevance_score'], reverse=True)
             
             report.append(f"\n🏆 TOP RELEVANT PDFs")
-            for i, (url, analysis) in enumerate(relevant_pdfs[:5], 1):
-                category = analysis['categorization']['primary_category']
-                score = analysis['categorization']['relevance_score']
-                pages = analysis['metadata'].get('page_count', 0)
-                title = analysis['metadata'].get('title', 'No title')[:50]
+            for i, (url, analysis, categorization) in enumerate(relevant_pdfs[:5], 1):
+                metadata = analysis['metadata']
+                category = categorization['primary_category']
+                score = categorization['relevance_score']
+                pages = metadata.get('page_count', 0)
+                title = metadata.get('title', 'No title')[:50]
                 report.append(f"{i}. {category} (score: {score}) | {pages}p | {title}")
                 report.append(f"   URL: {url}")
         
@@ -476,8 +517,8 @@ def test_pdf_quality_analysis():
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     results_file = f"pdf_quality_analysis_{timestamp}.json"
     
-    with open(results_file, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    with open(results_file, 'wb') as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str))
     
     print(f"\n💾 Detailed results saved to: {results_file}")
     
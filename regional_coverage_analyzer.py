@@ -15,12 +15,8 @@ Date: October 2025
 
 import re
 import logging
-from pathlib import Path
-from typing import Dict, List, Set, Tuple
-import pandas as pd
-import json
+from typing import Dict, List, Set
 from collections import defaultdict, Counter
-from urllib.parse import urlparse
 
 class RegionalCoverageAnalyzer:
     """Analyzes regional coverage patterns in healthcare payer discoveries"""
@@ -282,14 +278,6 @@ class RegionalCoverageAnalyzer:
                     f"/regional/{region.lower()}/"
                 ]
                 
-                # Search terms
-                search_terms = [
-                    f"{state_name} provider manual",
-                    f"{region} medicaid",
-                    f"{state_name} specific guidelines",
-                    f"{region} authorization requirements"
-                ]
-                
                 strategy['search_patterns'].extend(url_patterns)
                 strategy['recommended_actions'].append(
                     f"Search for {state_name} ({region}) specific content"
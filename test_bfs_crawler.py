@@ -4,34 +4,80 @@ Test BFS Crawler - Enhanced PDF Discovery
 Simple test to see if BFS can find more PDFs than direct URLs
 """
 
-import time
 import logging
-from collections import deque
-from urllib.parse import urljoin, urlparse
-from pathlib import Path
-import requests
-from bs4 import BeautifulSoup
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from payer_portal_crawler import BLOCKED_RESOURCE_PATTERNS, create_http_session, extract_links
+from crawl_state import CrawlState, crawl_id
+from crawl_urls import canonicalize, resolve_link
+
+# Returns [href, text] for every link in the rendered page, matching extract_anchors
+ANCHORS_SCRIPT = """
+return Array.from(document.querySelectorAll('a[href]'),
+                  a => [a.getAttribute('href'), a.textContent.trim()]);
+"""
+
+# Keywords that make a link worth recording and following, as one alternation
+RELEVANT_LINK_KEYWORDS = (
+    'provider', 'manual', 'guide', 'policy', 'procedure',
+    'prior auth', 'authorization', 'timely filing', 'appeals',
+    'claims', 'billing', 'coverage', 'benefits', 'forms'
+)
+RELEVANT_LINK_RE = re.compile('|'.join(map(re.escape, RELEVANT_LINK_KEYWORDS)))
+
+# '.pdf' as a whole extension anywhere in the URL (path end, query value, ...)
+# but not as a prefix like '.pdfx'; ambiguous hits are confirmed by confirm_pdf
+PDF_URL_RE = re.compile(r'\.pdf(?![a-z0-9])', re.IGNORECASE)
+
 
 class SimpleBFSCrawler:
     """Simple BFS crawler to test PDF discovery"""
     
-    def __init__(self, headless=True, max_depth=2):
+    def __init__(self, headless=True, max_depth=2, state_db=None, max_workers=8,
+                 host_interval=0.0):
+        """
+        Args:
+            headless: Run Chrome without a window
+            max_depth: Maximum link depth to explore from the start URLs
+            state_db: Optional SQLite file holding crawl progress; when set,
+                each finished BFS level is saved there and a later run with
+                the same file, start URLs and allowed domains resumes it
+            max_workers: Pages fetched concurrently within one BFS level
+            host_interval: Minimum seconds between page fetches from the same
+                host (0 disables pacing); pages on different hosts are
+                fetched in parallel either way
+        """
         self.headless = headless
         self.max_depth = max_depth
+        self.max_workers = max_workers
         self.visited_urls = set()
         self.discovered_pdfs = set()
+        self.pdf_checks = {}  # url -> confirmed PDF, for ambiguous '.pdf' links
+        self.host_interval = host_interval
+        self._host_next_fetch = {}  # host -> earliest time (monotonic) of its next page request
+        self._host_lock = threading.Lock()
         self.setup_webdriver()
         
+        # Plain HTTP session for static pages; Chrome is only the fallback.
+        # Pool one connection per worker so concurrent fetches to a host reuse them
+        self.session = create_http_session(pool_size=max_workers)
+        
         # Configure logging
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
+        
+        self.state_db = state_db
+        self.state = None  # CrawlState of the crawl in progress, when state_db is set
     
     def setup_webdriver(self):
         """Setup Chrome WebDriver"""
@@ -40,82 +86,260 @@ class SimpleBFSCrawler:
             chrome_options.add_argument('--headless')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--disable-background-networking')
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        # Return from driver.get at DOMContentLoaded; link waits are explicit
+        chrome_options.page_load_strategy = 'eager'
         
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        # Selenium Manager (Selenium 4.6+) locates and caches chromedriver itself
+        self.driver = webdriver.Chrome(options=chrome_options)
         self.driver.set_page_load_timeout(30)
+        
+        # Only links are read, so don't download styles, fonts or media
+        self.driver.execute_cdp_cmd('Network.enable', {})
+        self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(BLOCKED_RESOURCE_PATTERNS)})
     
     def close(self):
+        self.session.close()
+        if self.state:
+            self.state.close()
+            self.state = None
         if self.driver:
             self.driver.quit()
     
     def is_pdf_url(self, url):
         """Check if URL points to a PDF"""
-        return url.lower().endswith('.pdf') or '.pdf' in url.lower()
+        return PDF_URL_RE.search(url) is not None
+    
+    def confirm_pdf(self, url):
+        """
+        Confirm that a URL serves a PDF without downloading it
+        
+        URLs whose path ends in .pdf are trusted as-is. Others (e.g. '.pdf'
+        only in a query string) are checked with a HEAD request, falling back
+        to a one-byte ranged GET for servers that reject HEAD. Results are
+        cached per URL.
+        """
+        if urlparse(url).path.lower().endswith('.pdf'):
+            return True
+        
+        if url in self.pdf_checks:
+            return self.pdf_checks[url]
+        
+        is_pdf = False
+        try:
+            response = self.session.head(url, timeout=10, allow_redirects=True)
+            if response.status_code in (403, 404, 405, 501):
+                response = self.session.get(
+                    url, headers={'Range': 'bytes=0-0'}, timeout=10, stream=True
+                )
+                response.close()
+            is_pdf = (response.ok and
+                      'application/pdf' in response.headers.get('content-type', '').lower())
+        except Exception as e:
+            self.logger.debug(f"PDF check failed for {url}: {e}")
+        
+        self.pdf_checks[url] = is_pdf
+        return is_pdf
     
     def is_relevant_link(self, text, href):
         """Check if link is relevant for healthcare provider content"""
-        text_lower = text.lower()
-        href_lower = href.lower()
+        # One lowercase and one scan over text and href together
+        return RELEVANT_LINK_RE.search(f"{text} {href}".lower()) is not None
+    
+    def wait_for_host(self, url):
+        """
+        Block until the URL's host may be requested again
+        
+        Each caller reserves the host's next free slot under the lock and then
+        sleeps outside it, so workers on one host go out host_interval apart
+        while other hosts are not held up.
+        """
+        if not self.host_interval:
+            return
+        host = urlparse(url).netloc.lower()
+        with self._host_lock:
+            now = time.monotonic()
+            slot = max(now, self._host_next_fetch.get(host, 0))
+            self._host_next_fetch[host] = slot + self.host_interval
+        if slot > now:
+            time.sleep(slot - now)
+    
+    def fetch_page_html(self, url):
+        """
+        Fetch a page's static HTML over plain HTTP
+        
+        Returns:
+            (html, final_url) after redirects, or None if the page could not
+            be fetched as HTML
+        """
+        try:
+            self.wait_for_host(url)
+            response = self.session.get(url, timeout=15)
+            response.raise_for_status()
+            if 'html' not in response.headers.get('content-type', '').lower():
+                return None
+            return response.text, response.url
+        except Exception as e:
+            self.logger.debug(f"Static fetch failed for {url}: {e}")
+            return None
+    
+    def fetch_links_with_browser(self, url):
+        """
+        Render a page in Chrome for portals that build their links with JavaScript
+        
+        Returns:
+            (links, final_url): the page's (href, text) pairs and the URL the
+            browser ended up on
+        """
+        self.driver.get(url)
         
-        relevant_keywords = [
-            'provider', 'manual', 'guide', 'policy', 'procedure',
-            'prior auth', 'authorization', 'timely filing', 'appeals',
-            'claims', 'billing', 'coverage', 'benefits', 'forms'
-        ]
+        # Wait until links are in the DOM rather than sleeping a fixed time;
+        # a page that never renders any still gets parsed as-is
+        try:
+            WebDriverWait(self.driver, 8).until(
+                EC.presence_of_all_elements_located((By.TAG_NAME, "a"))
+            )
+        except TimeoutException:
+            self.logger.debug(f"No links rendered on {url} within timeout")
         
-        combined = f"{text_lower} {href_lower}"
-        return any(keyword in combined for keyword in relevant_keywords)
+        # Read just the anchors in the browser instead of serializing the whole
+        # DOM to page_source and re-parsing it; fall back to that if the script fails
+        try:
+            links = [tuple(link) for link in self.driver.execute_script(ANCHORS_SCRIPT)]
+        except WebDriverException as e:
+            self.logger.debug(f"Anchor script failed on {url}, parsing page source: {e}")
+            links = self.extract_anchors(self.driver.page_source)
+        return links, self.driver.current_url
+    
+    def has_wanted_links(self, links):
+        """Whether a page's links include a PDF or a relevant page worth following"""
+        return any(self.is_pdf_url(href) or self.is_relevant_link(text, href)
+                   for href, text in links)
+    
+    def extract_anchors(self, html):
+        """Return (href, text) pairs for every link in the page"""
+        return extract_links(html)
+    
+    def fetch_level(self, urls):
+        """
+        Fetch the links of every page in one BFS level
+        
+        Pages are fetched concurrently over HTTP, paced per host by
+        wait_for_host. A page whose static HTML has no PDF or relevant links
+        (e.g. an app shell with only navigation) is rendered in Chrome
+        afterwards; that retry of the same page is not paced again. The
+        driver is not thread-safe, so the browser fallback runs one page at
+        a time.
+        
+        Returns:
+            Dict mapping each URL to (base_url, links, fetched): the final
+            URL the page was served from, to resolve its relative links
+            against, its list of (href, text) pairs, and whether either
+            fetch succeeded (False when both HTTP and Chrome failed)
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pages = dict(zip(urls, executor.map(self.fetch_page_html, urls)))
+        
+        level_links = {}
+        for url, page in pages.items():
+            html, base_url = page if page else (None, url)
+            links = self.extract_anchors(html) if html else []
+            fetched = page is not None
+            
+            if not self.has_wanted_links(links):
+                try:
+                    links, base_url = self.fetch_links_with_browser(url)
+                    fetched = True
+                except Exception as e:
+                    self.logger.warning(f"Error processing {url}: {e}")
+            
+            level_links[url] = (base_url, links, fetched)
+        
+        return level_links
     
     def discover_pdfs_bfs(self, start_urls, allowed_domains):
-        """Discover PDFs using BFS traversal"""
-        # Initialize queue with (url, depth)
-        queue = deque([(url, 0) for url in start_urls])
+        """
+        Discover PDFs using level-by-level BFS traversal
+        
+        Args:
+            start_urls: Pages the crawl starts from
+            allowed_domains: Domains (and their subdomains) the crawl may enter
+        """
+        # URLs are fetched as linked; canonicalize() only builds the keys that
+        # visited_urls, enqueued and pdfs_found de-duplicate on
+        start_pages = {}
+        for url in start_urls:
+            start_pages.setdefault(canonicalize(url), url)
+        frontier = list(start_pages.values())
+        start_depth = 0
+        pdfs_found = {}  # canonical key -> PDF URL
+        
+        # Pick up where a previous run of this same crawl stopped; state saved
+        # for other start URLs or domains in the file is left alone
+        resumed = None
+        if self.state_db:
+            if self.state:
+                self.state.close()
+            self.state = CrawlState(self.state_db, crawl_id(start_urls, allowed_domains))
+            resumed = self.state.load()
+        if resumed:
+            self.logger.info(f"Resuming crawl: {len(resumed['visited'])} visited, "
+                             f"{len(resumed['frontier'])} queued at depth {resumed['depth']}")
+            self.visited_urls.update(resumed['visited'])
+            pdfs_found = resumed['pdfs']
+            # A finished crawl just reports what it found
+            frontier = [] if resumed['finished'] else resumed['frontier']
+            # Retried failures may be all that is left after the last level
+            start_depth = min(resumed['depth'], self.max_depth)
+        
+        # Everything ever queued (or already visited), so a link found on
+        # several pages is only fetched once
+        enqueued = self.visited_urls | {canonicalize(url) for url in frontier}
+        
+        # A host is allowed if it is a listed domain or a subdomain of one.
+        # (A plain substring test also let lookalikes such as evil-anthem.com in.)
+        allowed_hosts = frozenset(domain.lower() for domain in allowed_domains)
+        allowed_suffixes = tuple('.' + domain for domain in allowed_hosts)
         
         all_links_found = []
-        pdfs_found = set()
         
-        while queue and len(self.visited_urls) < 50:  # Limit to prevent excessive crawling
-            current_url, depth = queue.popleft()
+        for depth in range(start_depth, self.max_depth + 1):
+            # Claim this level's unvisited URLs, up to the overall visit limit
+            level = []
+            for url in frontier:
+                if len(self.visited_urls) >= 50:  # Limit to prevent excessive crawling
+                    break
+                key = canonicalize(url)
+                if key not in self.visited_urls:
+                    self.visited_urls.add(key)
+                    level.append(url)
             
-            # Skip if already visited or max depth reached
-            if current_url in self.visited_urls or depth > self.max_depth:
-                continue
+            if not level:
+                break
             
-            self.visited_urls.add(current_url)
-            self.logger.info(f"Exploring (depth {depth}): {current_url}")
+            self.logger.info(f"Exploring depth {depth}: {len(level)} pages")
+            next_frontier = []
+            fetched_urls, failed_urls = [], []
             
-            try:
-                # Navigate to URL
-                self.driver.get(current_url)
-                time.sleep(2)  # Be respectful
-                
-                # Wait for page to load
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
+            for current_url, (base_url, links, fetched) in self.fetch_level(level).items():
+                (fetched_urls if fetched else failed_urls).append(current_url)
+                self.logger.debug("Found %d links on %s", len(links), current_url)
                 
-                # Parse page
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                
-                # Find all links
-                links = soup.find_all('a', href=True)
-                self.logger.info(f"Found {len(links)} links on page")
-                
-                for link in links:
-                    href = link['href']
-                    text = link.get_text(strip=True)
-                    
-                    # Convert to absolute URL
-                    absolute_url = urljoin(current_url, href)
+                for href, text in links:
+                    # Resolve against the page as served; de-duplicate on the canonical key
+                    absolute_url = resolve_link(base_url, href)
+                    key = canonicalize(absolute_url)
                     
                     # Check if it's within allowed domains
-                    parsed = urlparse(absolute_url)
-                    if not any(domain in parsed.netloc for domain in allowed_domains):
+                    host = (urlparse(absolute_url).hostname or '').lower()
+                    if host not in allowed_hosts and not host.endswith(allowed_suffixes):
                         continue
                     
                     # Record all relevant links
-                    if self.is_relevant_link(text, href):
+                    is_relevant = self.is_relevant_link(text, href)
+                    if is_relevant:
                         all_links_found.append({
                             'url': absolute_url,
                             'text': text,
@@ -123,24 +347,33 @@ class SimpleBFSCrawler:
                             'parent': current_url
                         })
                     
-                    # Check if it's a PDF
-                    if self.is_pdf_url(absolute_url):
-                        pdfs_found.add(absolute_url)
-                        self.logger.info(f"Found PDF: {absolute_url}")
+                    # Check if it's a PDF (confirmed by headers when the path is ambiguous)
+                    if key in pdfs_found:
+                        continue
+                    if self.is_pdf_url(absolute_url) and self.confirm_pdf(absolute_url):
+                        pdfs_found[key] = absolute_url
+                        self.logger.debug("Found PDF: %s", absolute_url)
                     
-                    # Add to queue for further exploration if relevant and within depth
-                    elif (self.is_relevant_link(text, href) and 
+                    # Add to next level for further exploration if relevant and within depth
+                    elif (is_relevant and 
                           depth < self.max_depth and 
-                          absolute_url not in self.visited_urls):
-                        queue.append((absolute_url, depth + 1))
-                
-            except Exception as e:
-                self.logger.warning(f"Error processing {current_url}: {e}")
-                continue
+                          key not in enqueued):
+                        enqueued.add(key)
+                        next_frontier.append(absolute_url)
+            
+            self.logger.info("Depth %d done: %d PDFs found so far", depth, len(pdfs_found))
+            frontier = next_frontier
+            
+            if self.state:
+                self.state.save_level(fetched_urls, failed_urls, pdfs_found, frontier, depth + 1)
+        
+        # Stopping at the visit limit leaves a partial crawl to resume later
+        if self.state and not frontier:
+            self.state.mark_finished()
         
         return {
             'all_links': all_links_found,
-            'pdfs_discovered': list(pdfs_found),
+            'pdfs_discovered': list(pdfs_found.values()),
             'urls_visited': list(self.visited_urls),
             'total_links_found': len(all_links_found),
             'total_pdfs_found': len(pdfs_found),
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Unit tests for resumable BFS crawl state (temp SQLite file, no browser or network needed)
+"""
+
+from crawl_state import CrawlState, crawl_id
+from crawl_urls import canonicalize
+
+START_URLS = ["https://providers.anthem.com/"]
+DOMAINS = ["anthem.com"]
+MANUAL = "https://providers.anthem.com/docs/manual.pdf"
+
+
+def open_state(path, start_urls=START_URLS, domains=DOMAINS):
+    return CrawlState(str(path), crawl_id(start_urls, domains))
+
+
+def test_save_level_round_trips_through_load(tmp_path):
+    """A saved level resumes with its frontier and PDFs; failed pages are retried, not visited"""
+    db = tmp_path / "crawl.db"
+    state = open_state(db)
+    assert state.load() is None
+    state.save_level(
+        fetched=["https://providers.anthem.com/"],
+        failed=["https://providers.anthem.com/down"],
+        pdfs_found={"https://providers.anthem.com/docs/manual.pdf": MANUAL},
+        next_frontier=["https://providers.anthem.com/forms"],
+        next_depth=1
+    )
+    state.close()
+
+    resumed = open_state(db).load()
+    assert resumed['depth'] == 1
+    assert resumed['visited'] == {canonicalize("https://providers.anthem.com/")}
+    assert resumed['frontier'] == ["https://providers.anthem.com/down",
+                                   "https://providers.anthem.com/forms"]
+    assert list(resumed['pdfs'].values()) == [MANUAL]
+    assert not resumed['finished']
+
+
+def test_retried_page_leaves_failed_list(tmp_path):
+    """A page that failed once and then fetched is visited and no longer queued"""
+    state = open_state(tmp_path / "crawl.db")
+    state.save_level(["https://providers.anthem.com/"], ["https://providers.anthem.com/down"], {}, [], 1)
+    state.save_level(["https://providers.anthem.com/down"], [], {}, [], 2)
+    state.mark_finished()
+
+    resumed = state.load()
+    assert resumed['frontier'] == []
+    assert canonicalize("https://providers.anthem.com/down") in resumed['visited']
+    assert resumed['finished']
+
+
+def test_finished_only_without_pending_failures(tmp_path):
+    """A crawl that ran out of pages is finished unless some page still needs a retry"""
+    state = open_state(tmp_path / "crawl.db")
+    state.save_level(["https://providers.anthem.com/"], ["https://providers.anthem.com/down"], {}, [], 1)
+    state.mark_finished()
+    assert not state.load()['finished']
+
+    other = open_state(tmp_path / "crawl.db", start_urls=["https://www.aetna.com/"], domains=["aetna.com"])
+    other.save_level(["https://www.aetna.com/"], [], {}, [], 1)
+    other.mark_finished()
+    assert other.load()['finished']
+
+
+def test_state_is_keyed_by_start_urls_and_domains(tmp_path):
+    """Another crawl sharing the file starts fresh; the same crawl spelled differently resumes"""
+    db = tmp_path / "crawl.db"
+    state = open_state(db)
+    state.save_level(["https://providers.anthem.com/"], [], {}, ["https://providers.anthem.com/forms"], 1)
+    state.close()
+
+    assert open_state(db, start_urls=["https://www.aetna.com/"]).load() is None
+    assert open_state(db, domains=["anthem.com", "elevancehealth.com"]).load() is None
+    assert open_state(db, start_urls=["HTTPS://Providers.Anthem.com"], domains=["Anthem.com"]).load() is not None
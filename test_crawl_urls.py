@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the BFS crawler's URL helpers (no browser or network needed)
+"""
+
+from crawl_urls import canonicalize, resolve_link
+
+
+def test_canonicalize_merges_url_variants():
+    """Fragment, tracking params, default port, case, param order and trailing slash share a key"""
+    key = canonicalize("https://providers.anthem.com/docs?a=1&b=2")
+    assert canonicalize("HTTPS://Providers.Anthem.com:443/docs/?b=2&a=1&utm_source=nav#top") == key
+    assert canonicalize("https://providers.anthem.com/docs?a=1&b=3") != key
+
+
+def test_relative_links_resolve_against_page_url():
+    """Links resolve against the page URL as served, not its canonical key"""
+    page_url = "https://providers.anthem.com/docs/"
+    assert resolve_link(page_url, "gpp/OH_CAID_ProviderManual.pdf") == \
+        "https://providers.anthem.com/docs/gpp/OH_CAID_ProviderManual.pdf"
+    assert resolve_link(page_url, "/provider-support/#forms") == \
+        "https://providers.anthem.com/provider-support/"
+    assert resolve_link(page_url, "list?v") == "https://providers.anthem.com/docs/list?v"